@@ -25,18 +25,23 @@ Binary Resolution:
     5. Local paths: ./moo, ./build/moo
 """
 
+from __future__ import annotations
+
+import copy
+import functools
 import os
 import platform
 import shutil
-import tempfile
+import time
 from pathlib import Path
-from typing import Generator, Dict, List, Optional
+from typing import TYPE_CHECKING, Generator, Dict, List, Optional, Set
 
 import pytest
 
-from lib.protocol import ServerConfig, ServerPair
-from lib.moo_server import MooServer, MooClient
-from harness.config import get_config
+if TYPE_CHECKING:
+    from lib.features import ServerFeatures
+    from lib.moo_server import MooServer, MooClient
+    from lib.protocol import ServerConfig, ServerPair
 
 
 # ============================================================================
@@ -96,7 +101,7 @@ def pytest_addoption(parser):
 
 
 def pytest_configure(config):
-    """Register custom markers."""
+    """Register custom markers and precompute server_pair parameters."""
     config.addinivalue_line(
         "markers", "persistence: marks tests that test data persistence"
     )
@@ -115,6 +120,24 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "longrun: marks tests that take 60+ seconds (skipped unless --longrun)"
     )
+    config.addinivalue_line(
+        "markers",
+        "requires(*features): skip unless the candidate server has the named "
+        "features (see FEATURE_MAP)"
+    )
+
+    priors = []
+    for prior_arg in config.getoption("--prior") or []:
+        if ':' not in prior_arg:
+            raise pytest.UsageError(
+                f"Invalid --prior format: {prior_arg}. Use 'name:path'"
+            )
+        name, path = prior_arg.split(':', 1)
+        priors.append((name, path))
+    config._priors = priors
+    config._server_pair_params = ('persistence',) + tuple(
+        f'upgrade_from_{name}' for name, _ in priors
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -124,15 +147,15 @@ def pytest_collection_modifyitems(config, items):
         return
 
     skip_longrun = pytest.mark.skip(reason="longrun test: use --longrun to include")
-    for item in items:
-        if "longrun" in item.keywords:
-            item.add_marker(skip_longrun)
+    for item in [item for item in items if "longrun" in item.keywords]:
+        item.add_marker(skip_longrun)
 
 
 # ============================================================================
 # Server Binary Fixtures
 # ============================================================================
 
+@functools.lru_cache(maxsize=8)
 def _find_default_binary(project_root: Path) -> Optional[Path]:
     """Find the default MOO binary using config system and common locations.
 
@@ -141,13 +164,17 @@ def _find_default_binary(project_root: Path) -> Optional[Path]:
     2. Configuration file (moo_binary setting)
     3. Build cache
     4. Local paths relative to project_root
+
+    The result is memoized per project_root for the life of the process.
     """
+    from harness.config import get_config
+
     config = get_config()
 
     # Check environment variable
     if env_binary := os.environ.get("MOO_BINARY"):
-        path = Path(env_binary).expanduser()
-        if path.exists() and path.is_file():
+        path = Path(os.path.expanduser(env_binary))
+        if path.is_file():
             return path.resolve()
 
     # Check configured path
@@ -155,12 +182,15 @@ def _find_default_binary(project_root: Path) -> Optional[Path]:
         return config.moo_binary.resolve()
 
     # Check build cache for any cached binaries
-    if config.build_cache_dir.exists():
-        for subdir in config.build_cache_dir.iterdir():
-            if subdir.is_dir():
-                binary = subdir / "moo"
-                if binary.exists():
-                    return binary.resolve()
+    try:
+        with os.scandir(config.build_cache_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    binary = Path(entry.path) / "moo"
+                    if binary.is_file():
+                        return binary.resolve()
+    except FileNotFoundError:
+        pass
 
     # Check local paths relative to project root
     candidates = [
@@ -170,7 +200,7 @@ def _find_default_binary(project_root: Path) -> Optional[Path]:
         project_root.parent / 'build' / 'moo',
     ]
     for candidate in candidates:
-        if candidate.exists() and candidate.is_file():
+        if candidate.is_file():
             return candidate.resolve()
 
     return None
@@ -191,6 +221,8 @@ def tests_dir() -> Path:
 @pytest.fixture(scope='session')
 def candidate_config(request, project_root) -> ServerConfig:
     """Get configuration for the candidate (new) server."""
+    from lib.protocol import ServerConfig
+
     binary_path = request.config.getoption("--candidate")
     name = request.config.getoption("--candidate-name")
     features_opt = request.config.getoption("--candidate-features")
@@ -228,14 +260,11 @@ def candidate_config(request, project_root) -> ServerConfig:
 @pytest.fixture(scope='session')
 def prior_configs(request) -> Dict[str, ServerConfig]:
     """Get configurations for prior (old) server versions."""
-    prior_args = request.config.getoption("--prior")
-    configs = {}
+    from lib.protocol import ServerConfig
 
-    for prior_arg in prior_args:
-        if ':' not in prior_arg:
-            pytest.fail(f"Invalid --prior format: {prior_arg}. Use 'name:path'")
+    configs = {}
 
-        name, path = prior_arg.split(':', 1)
+    for name, path in request.config._priors:
         binary_path = Path(path).resolve()
 
         if not binary_path.exists():
@@ -255,53 +284,70 @@ def prior_configs(request) -> Dict[str, ServerConfig]:
 # ============================================================================
 
 @pytest.fixture(scope='session')
-def candidate_server(candidate_config, request) -> Generator[MooServer, None, None]:
-    """Provide a server manager for the candidate binary."""
+def moo_work_root(tmp_path_factory, request) -> Generator[Path, None, None]:
+    """Provide one scratch directory holding every server's working files.
+
+    With --keep-artifacts the directory is copied to
+    <database_dir>/artifacts/<timestamp> at the end of the session;
+    otherwise it is removed.
+    """
     keep_artifacts = request.config.getoption("--keep-artifacts")
-    trace = request.config.getoption("--moo-trace")
-    work_dir = Path(tempfile.mkdtemp(prefix='moo_candidate_'))
+    root = tmp_path_factory.mktemp('moo', numbered=False)
+    yield root
 
-    server = MooServer(candidate_config, work_dir, trace=trace)
+    if keep_artifacts:
+        from harness.config import get_config
+
+        dest = get_config().database_dir / 'artifacts' / time.strftime('%Y%m%d-%H%M%S')
+        shutil.copytree(root, dest, dirs_exist_ok=True)
+    else:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture(scope='session')
+def candidate_server(candidate_config, moo_work_root, request) -> Generator[MooServer, None, None]:
+    """Provide a server manager for the candidate binary."""
+    from lib.moo_server import MooServer
+
+    trace = request.config.getoption("--moo-trace")
+    server = MooServer(candidate_config, moo_work_root / 'candidate', trace=trace)
     yield server
     server.stop_all()
 
-    if not keep_artifacts:
-        shutil.rmtree(work_dir, ignore_errors=True)
-
 
 @pytest.fixture(scope='session')
 def prior_db_dirs(prior_configs, db_base_dir) -> Dict[str, Path]:
     """Return database directories for all prior servers."""
+    if not prior_configs:
+        return {}
+
     dirs = {}
     for name in prior_configs:
-        db_dir = _get_server_db_dir(db_base_dir, name)
-        db_dir.mkdir(parents=True, exist_ok=True)
+        db_dir = _ensure_dir(_get_server_db_dir(db_base_dir, name))
         dirs[name] = db_dir
     return dirs
 
 
 @pytest.fixture(scope='session')
-def prior_servers(prior_configs, request) -> Generator[Dict[str, MooServer], None, None]:
+def prior_servers(prior_configs, moo_work_root, request) -> Generator[Dict[str, MooServer], None, None]:
     """Provide server managers for all prior versions."""
-    keep_artifacts = request.config.getoption("--keep-artifacts")
-    trace = request.config.getoption("--moo-trace")
-    servers = {}
-    work_dirs = []
+    if not prior_configs:
+        yield {}
+        return
 
-    for name, config in prior_configs.items():
-        work_dir = Path(tempfile.mkdtemp(prefix=f'moo_{name}_'))
-        work_dirs.append(work_dir)
-        servers[name] = MooServer(config, work_dir, trace=trace)
+    from lib.moo_server import MooServer
+
+    trace = request.config.getoption("--moo-trace")
+    servers = {
+        name: MooServer(config, moo_work_root / f'prior_{name}', trace=trace)
+        for name, config in prior_configs.items()
+    }
 
     yield servers
 
     for server in servers.values():
         server.stop_all()
 
-    if not keep_artifacts:
-        for work_dir in work_dirs:
-            shutil.rmtree(work_dir, ignore_errors=True)
-
 
 # ============================================================================
 # Server Pair Fixtures (for persistence/upgrade tests)
@@ -321,7 +367,7 @@ def server_pair_ids(prior_configs) -> List[str]:
     return _get_server_pair_params(prior_configs)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def server_pair(request, candidate_server, prior_servers, candidate_config, prior_configs,
                 candidate_db_dir, prior_db_dirs) -> ServerPair:
     """Provide a (write_server, read_server) pair for testing.
@@ -330,7 +376,12 @@ def server_pair(request, candidate_server, prior_servers, candidate_config, prio
     For upgrade tests: write_server = prior, read_server = candidate
 
     Each pair includes the appropriate database directory for the write server.
+    The pair only bundles session-scoped servers and directories, so it is
+    shared by every test in a module; tests copy write_server_db before
+    using it.
     """
+    from lib.protocol import ServerPair
+
     param = request.param
 
     if param == 'persistence':
@@ -358,20 +409,10 @@ def server_pair(request, candidate_server, prior_servers, candidate_config, prio
 def pytest_generate_tests(metafunc):
     """Dynamically generate test parameters for server_pair fixture."""
     if 'server_pair' in metafunc.fixturenames:
-        # Get prior configs from command line
-        prior_args = metafunc.config.getoption("--prior") or []
-        prior_names = []
-        for prior_arg in prior_args:
-            if ':' in prior_arg:
-                name, _ = prior_arg.split(':', 1)
-                prior_names.append(name)
-
-        # Generate parameters
-        params = ['persistence']
-        for name in prior_names:
-            params.append(f'upgrade_from_{name}')
-
-        metafunc.parametrize('server_pair', params, indirect=True)
+        metafunc.parametrize(
+            'server_pair', metafunc.config._server_pair_params,
+            indirect=True, scope='module',
+        )
 
 
 # ============================================================================
@@ -381,16 +422,27 @@ def pytest_generate_tests(metafunc):
 @pytest.fixture(scope='session')
 def db_base_dir(request) -> Path:
     """Return base directory for server-scoped databases."""
+    from harness.config import get_config
+
     config = get_config()
     keep_artifacts = request.config.getoption("--keep-artifacts")
 
     # Use configured database_dir as base
-    base_dir = config.database_dir
-    base_dir.mkdir(parents=True, exist_ok=True)
+    return _ensure_dir(config.database_dir)
+
+
+_ensured_dirs: Set[Path] = set()
+
 
-    return base_dir
+def _ensure_dir(path: Path) -> Path:
+    """Create path (and parents) once per session and return it."""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+    return path
 
 
+@functools.lru_cache(maxsize=None)
 def _get_server_db_dir(db_base_dir: Path, server_name: str) -> Path:
     """Get database directory for a specific server."""
     return db_base_dir / server_name
@@ -399,9 +451,7 @@ def _get_server_db_dir(db_base_dir: Path, server_name: str) -> Path:
 @pytest.fixture(scope='session')
 def candidate_db_dir(db_base_dir, candidate_config) -> Path:
     """Return database directory for candidate server."""
-    db_dir = _get_server_db_dir(db_base_dir, candidate_config.name)
-    db_dir.mkdir(parents=True, exist_ok=True)
-    return db_dir
+    return _ensure_dir(_get_server_db_dir(db_base_dir, candidate_config.name))
 
 
 @pytest.fixture(scope='session')
@@ -434,9 +484,17 @@ def minimal_db(candidate_db_dir, candidate_config) -> Path:
 
 @pytest.fixture
 def temp_db(minimal_db, tmp_path) -> Path:
-    """Provide a temporary copy of the minimal database."""
+    """Provide a per-test path to the minimal database.
+
+    The file is a hard link to minimal_db when the filesystem allows it, so
+    treat it as read-only; MooServer.start() copies it before the server
+    writes anything.
+    """
     temp_db_path = tmp_path / 'test.db'
-    shutil.copy(minimal_db, temp_db_path)
+    try:
+        os.link(minimal_db, temp_db_path)
+    except OSError:
+        shutil.copy(minimal_db, temp_db_path)
     return temp_db_path
 
 
@@ -554,34 +612,43 @@ def platform_config() -> dict:
 # Feature Detection
 # ============================================================================
 
-from lib.features import ServerFeatures, detect_features
+@pytest.fixture(scope='session')
+def server_features(probed_features) -> list:
+    """Get the list of features enabled in the server."""
+    return list(probed_features.features)
 
 
-@pytest.fixture
-def server_features(client) -> list:
-    """Get the list of features enabled in the server."""
-    success, result = client.eval('server_version("features")')
-    if not success:
-        return []
-
-    features = []
-    if result.startswith('{') and result.endswith('}'):
-        content = result[1:-1]
-        for item in content.split(','):
-            item = item.strip().strip('"')
-            if item:
-                features.append(item)
-    return features
+@pytest.fixture(scope='session')
+def probed_features(candidate_server, minimal_db, request) -> ServerFeatures:
+    """Probe the candidate server's features once per session.
+
+    Server capabilities are fixed for a given binary, so a single dedicated
+    server instance is started, queried, and stopped.
+    """
+    from lib.features import detect_features
+
+    trace = request.config.getoption("--moo-trace")
+    instance = candidate_server.start(database=minimal_db)
+    try:
+        client = candidate_server.connect(instance, trace=trace)
+        try:
+            client.authenticate('Wizard')
+            return detect_features(client)
+        finally:
+            client.close()
+    finally:
+        candidate_server.stop(instance)
 
 
 @pytest.fixture
-def detected_features(client, candidate_config) -> ServerFeatures:
+def detected_features(probed_features, candidate_config) -> ServerFeatures:
     """Detect full server features using the features module.
 
     If candidate_config has known_features set (from --candidate-features),
-    those override the detected values.
+    those override the detected values. Overrides are applied to a copy of
+    the session-wide probe result.
     """
-    features = detect_features(client)
+    features = copy.copy(probed_features)
 
     # Apply known feature overrides from config
     known = candidate_config.features or {}
@@ -601,60 +668,40 @@ def detected_features(client, candidate_config) -> ServerFeatures:
     return features
 
 
-@pytest.fixture
-def requires_unicode(detected_features):
-    """Skip if Unicode support is not enabled."""
-    if not detected_features.has_unicode:
-        pytest.skip("Test requires Unicode support")
+# Feature name -> (ServerFeatures attribute, required value, skip reason)
+FEATURE_MAP = {
+    'unicode': ('has_unicode', True, "Test requires Unicode support"),
+    'no_unicode': ('has_unicode', False, "Test requires non-Unicode server"),
+    'waifs': ('has_waifs', True, "Test requires Waif support"),
+    'waif_dict': ('has_waif_dict', True, "Test requires Waif dictionary syntax"),
+    'xml': ('has_xml', True, "Test requires XML support"),
+    'i64': ('has_i64', True, "Test requires 64-bit integer support"),
+    'no_i64': ('has_i64', False, "Test requires 32-bit integer server (no i64)"),
+    'bitwise': ('has_bitwise', True, "Test requires BITWISE_OPERATORS support"),
+}
 
 
-@pytest.fixture
-def requires_waifs(detected_features):
-    """Skip if Waif support is not enabled."""
-    if not detected_features.has_waifs:
-        pytest.skip("Test requires Waif support")
-
-
-@pytest.fixture
-def requires_waif_dict(detected_features):
-    """Skip if Waif dictionary syntax is not enabled."""
-    if not detected_features.has_waif_dict:
-        pytest.skip("Test requires Waif dictionary syntax")
-
-
-@pytest.fixture
-def requires_xml(detected_features):
-    """Skip if XML support is not enabled."""
-    if not detected_features.has_xml:
-        pytest.skip("Test requires XML support")
-
-
-@pytest.fixture
-def requires_i64(detected_features):
-    """Skip if 64-bit integers are not enabled."""
-    if not detected_features.has_i64:
-        pytest.skip("Test requires 64-bit integer support")
-
-
-@pytest.fixture
-def requires_no_i64(detected_features):
-    """Skip if 64-bit integers ARE enabled (for testing 32-bit behavior)."""
-    if detected_features.has_i64:
-        pytest.skip("Test requires 32-bit integer server (no i64)")
-
-
-@pytest.fixture
-def requires_no_unicode(detected_features):
-    """Skip if Unicode IS enabled (for testing non-Unicode behavior)."""
-    if detected_features.has_unicode:
-        pytest.skip("Test requires non-Unicode server")
+@pytest.fixture(autouse=True)
+def _check_required_features(request):
+    """Skip tests whose @pytest.mark.requires features the server lacks.
 
+    Feature detection only runs for tests that carry the marker.
+    """
+    required = [
+        name
+        for marker in request.node.iter_markers('requires')
+        for name in marker.args
+    ]
+    if not required:
+        return
 
-@pytest.fixture
-def requires_bitwise(detected_features):
-    """Skip if bitwise operators are not enabled."""
-    if not detected_features.has_bitwise:
-        pytest.skip("Test requires BITWISE_OPERATORS support")
+    features = request.getfixturevalue('detected_features')
+    for name in required:
+        if name not in FEATURE_MAP:
+            pytest.fail(f"Unknown feature in requires marker: {name!r}")
+        attr, expected, reason = FEATURE_MAP[name]
+        if getattr(features, attr) != expected:
+            pytest.skip(reason)
 
 
 # ============================================================================
@@ -698,15 +745,15 @@ def pytest_runtest_makereport(item, call):
             # Try to get transcript from client fixture
             client = item.funcargs.get("client") or item.funcargs.get("traced_client")
             if client and hasattr(client, 'format_transcript'):
-                transcript = client.format_transcript()
+                transcript = client.format_transcript(max_bytes=64 * 1024)
                 if transcript:
                     report.longrepr = str(report.longrepr) + \
                         f"\n\n--- Network Transcript ---\n{transcript}\n"
 
             # Also try to get server log
             server_instance = item.funcargs.get("server")
-            if server_instance and hasattr(server_instance, 'get_log_contents'):
-                log = server_instance.get_log_contents()
+            if server_instance and hasattr(server_instance, 'get_log_tail'):
+                log = server_instance.get_log_tail(8192)
                 if log:
                     # Only show last 50 lines of log to avoid overwhelming output
                     log_lines = log.strip().split('\n')
@@ -28,34 +28,53 @@ Usage:
     moo-build --list-repos
 """
 
-import argparse
+import collections
+import errno
+import functools
 import hashlib
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Set, Tuple
 
 from .config import get_config, Config, get_build_config, list_build_configs, PREDEFINED_BUILD_CONFIGS, RepoConfig
 from .repos import (
+    add_worktree,
+    remove_worktree,
     get_or_clone_repo,
     get_commit_hash,
+    repo_lock,
     resolve_repo_url,
     list_known_repos,
     KNOWN_REPOS,
 )
 
 
+# Lines of streamed output kept for error messages
+_STREAM_TAIL_LINES = 50
+
+
 def run_cmd(
     cmd: List[str],
     cwd: Optional[Path] = None,
     env: Optional[dict] = None,
     capture: bool = True,
+    stream: bool = False,
 ) -> subprocess.CompletedProcess:
-    """Run a command and return the result."""
+    """Run a command and return the result.
+
+    With stream=True, stdout and stderr are merged and echoed as they are
+    produced instead of being buffered until exit; only the last
+    _STREAM_TAIL_LINES lines are kept, in the result's stderr.
+    """
     print(f"  Running: {' '.join(cmd)}")
+    if stream:
+        return _run_streamed(cmd, cwd, env)
     result = subprocess.run(
         cmd,
         cwd=cwd,
@@ -68,6 +87,94 @@ def run_cmd(
     return result
 
 
+def _run_streamed(
+    cmd: List[str],
+    cwd: Optional[Path],
+    env: Optional[dict],
+) -> subprocess.CompletedProcess:
+    """Run cmd, forwarding its output line by line."""
+    tail = collections.deque(maxlen=_STREAM_TAIL_LINES)
+    sys.stdout.flush()
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+        bufsize=1,
+    ) as proc:
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+    sys.stdout.flush()
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout="", stderr="".join(tail))
+
+
+# copy_file_range errors that mean "not supported here" rather than failure
+_COPY_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EOPNOTSUPP, errno.EINVAL}
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy a file's contents, in-kernel via copy_file_range where supported.
+
+    On reflink-capable filesystems this shares the data blocks instead of
+    copying them. Falls back to shutil.copyfile when the kernel or
+    filesystem cannot do the copy. Permission bits are not copied.
+
+    Args:
+        src: File to copy.
+        dst: Destination file (created or truncated).
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            if os.path.samefile(src, dst):
+                raise shutil.SameFileError(f"{src} and {dst} are the same file")
+        except FileNotFoundError:
+            pass
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                return
+            except OSError as e:
+                if e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+
+    shutil.copyfile(src, dst)
+
+
+def fast_clone_tree(src: Path, dst: Path) -> None:
+    """Copy a source tree, sharing file data with src where possible.
+
+    Tries a reflink copy (copy-on-write filesystems), then a plain copy.
+    Hardlinks are not used: configure, make and compilers rewrite some
+    outputs in place, which would modify the files in src as well.
+
+    Args:
+        src: Existing directory to copy.
+        dst: Destination directory (must not exist).
+    """
+    if shutil.which("cp"):
+        dst.mkdir(parents=True)
+        result = subprocess.run(
+            ["cp", "-a", "--reflink=always", f"{src}/.", str(dst)],
+            capture_output=True,
+        )
+        if result.returncode == 0:
+            return
+        shutil.rmtree(dst)
+
+    shutil.copytree(src, dst, symlinks=True)
+
+
+@functools.lru_cache(maxsize=256)
 def compute_build_hash(repo_url: str, ref: str, configure_flags: str) -> str:
     """Compute a hash for build caching based on inputs.
 
@@ -80,7 +187,7 @@ def compute_build_hash(repo_url: str, ref: str, configure_flags: str) -> str:
         Short hash string for cache key.
     """
     content = f"{repo_url}:{ref}:{configure_flags}"
-    return hashlib.sha256(content.encode()).hexdigest()[:12]
+    return hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
 
 
 def get_cached_build(
@@ -101,11 +208,7 @@ def get_cached_build(
         Path to cached binary if exists, None otherwise.
     """
     build_hash = compute_build_hash(repo_url, commit_hash, configure_flags)
-    cached_binary = config.build_cache_dir / build_hash / "moo"
-
-    if cached_binary.exists():
-        return cached_binary
-    return None
+    return config.build_index.get(build_hash)
 
 
 def cache_build(
@@ -132,24 +235,44 @@ def cache_build(
     cache_dir.mkdir(parents=True, exist_ok=True)
 
     cached_binary = cache_dir / "moo"
-    shutil.copy(binary_path, cached_binary)
+    _fast_copy(binary_path, cached_binary)
     cached_binary.chmod(0o755)
 
     # Write metadata
-    metadata_path = cache_dir / "build-info.txt"
-    with open(metadata_path, "w") as f:
-        f.write(f"repo: {repo_url}\n")
-        f.write(f"commit: {commit_hash}\n")
-        f.write(f"configure_flags: {configure_flags}\n")
+    (cache_dir / "build-info.txt").write_text(
+        f"repo: {repo_url}\n"
+        f"commit: {commit_hash}\n"
+        f"configure_flags: {configure_flags}\n"
+    )
+    config.build_index.add(build_hash, cached_binary)
 
     return cached_binary
 
 
+def _prepare_build_dirs(source_dir: Path, output_dir: Path) -> Tuple[Path, Path]:
+    """Make both build directories absolute and ensure output_dir exists.
+
+    Only relative paths are resolved, which avoids a realpath() walk for the
+    common case of paths under a fresh temporary directory.
+    """
+    source_dir = Path(source_dir)
+    if not source_dir.is_absolute():
+        source_dir = source_dir.resolve()
+    output_dir = Path(output_dir)
+    if not output_dir.is_absolute():
+        output_dir = output_dir.resolve()
+    if not output_dir.is_dir():
+        output_dir.mkdir(parents=True, exist_ok=True)
+    return source_dir, output_dir
+
+
 def build_with_script(
     source_dir: Path,
     output_dir: Path,
     build_script: str,
     make_jobs: int = 4,
+    stream: bool = True,
+    _paths_resolved: bool = False,
 ) -> Path:
     """Build MOO server using a custom build script.
 
@@ -158,13 +281,16 @@ def build_with_script(
         output_dir: Where to put the built binary.
         build_script: Path to build script (relative to source_dir).
         make_jobs: Number of parallel make jobs.
+        stream: If True, echo build output as it is produced; otherwise
+            it is captured and shown only on failure.
+        _paths_resolved: Internal; both directories are already absolute
+            and output_dir exists.
 
     Returns:
         Path to the built binary.
     """
-    source_dir = Path(source_dir).resolve()
-    output_dir = Path(output_dir).resolve()
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if not _paths_resolved:
+        source_dir, output_dir = _prepare_build_dirs(source_dir, output_dir)
 
     script_path = source_dir / build_script
     if not script_path.exists():
@@ -177,32 +303,153 @@ def build_with_script(
     env = dict(os.environ)
     env['MAKE_JOBS'] = str(make_jobs)
 
-    result = run_cmd([str(script_path)], cwd=source_dir, env=env)
+    result = run_cmd([str(script_path)], cwd=source_dir, env=env, stream=stream)
     if result.returncode != 0:
         raise RuntimeError(f"Build script failed: {result.stderr}")
 
     # Find the binary
+    top = _top_level_names(source_dir)
     binary_src = source_dir / "moo"
-    if not binary_src.exists():
+    if "moo" not in top:
         # Check common alternative locations
-        for alt in ["build/moo", "src/moo"]:
-            alt_path = source_dir / alt
-            if alt_path.exists():
+        for subdir in ["build", "src"]:
+            alt_path = source_dir / subdir / "moo"
+            if subdir in top and alt_path.exists():
                 binary_src = alt_path
                 break
-
-    if not binary_src.exists():
-        raise RuntimeError(f"Binary not found after build script completed")
+        else:
+            raise RuntimeError(f"Binary not found after build script completed")
 
     # Copy binary to output
     binary_dst = output_dir / "moo"
-    shutil.copy(binary_src, binary_dst)
+    _fast_copy(binary_src, binary_dst)
     binary_dst.chmod(0o755)
 
     print(f"Built binary: {binary_dst}")
     return binary_dst
 
 
+# Environment variables that change what ./configure generates
+_CONFIGURE_ENV_VARS = ("CC", "CFLAGS", "CPPFLAGS", "LDFLAGS", "LIBS")
+
+
+def _hash_files(h, directory: Path, names: List[str]) -> None:
+    """Feed the name and contents of each existing file into hash h."""
+    for name in names:
+        path = directory / name
+        if path.is_file():
+            h.update(name.encode() + b"\0")
+            h.update(path.read_bytes())
+            h.update(b"\0")
+
+
+def _autoconf_key(source_dir: Path) -> str:
+    """Cache key for autoconf output: configure.ac and aclocal.m4."""
+    h = hashlib.blake2b(digest_size=10)
+    _hash_files(h, source_dir, ["configure.ac", "aclocal.m4"])
+    return h.hexdigest()
+
+
+def _configure_key(source_dir: Path, configure_flags: str, env: Dict[str, str]) -> str:
+    """Cache key for configure output: the script, its templates, and flags."""
+    h = hashlib.blake2b(digest_size=10)
+    templates = sorted(
+        entry.name for entry in os.scandir(source_dir)
+        if entry.name.endswith(".in") and entry.is_file()
+    )
+    _hash_files(h, source_dir, ["configure"] + templates)
+    h.update(configure_flags.encode() + b"\0")
+    for var in _CONFIGURE_ENV_VARS:
+        h.update(f"{var}={env.get(var, '')}\0".encode())
+    return h.hexdigest()
+
+
+def _snapshot_files(directory: Path) -> Dict[str, int]:
+    """Map each regular file directly in directory to its mtime."""
+    with os.scandir(directory) as entries:
+        return {
+            entry.name: entry.stat().st_mtime_ns
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+        }
+
+
+# Records, in each generated-files cache entry, the source_dir it was made in
+_SOURCE_DIR_FILE = ".source-dir"
+
+
+def _store_generated_files(source_dir: Path, before: Dict[str, int], entry: Path) -> None:
+    """Save the top-level files created or changed since snapshot before."""
+    after = _snapshot_files(source_dir)
+    names = [name for name, mtime in after.items() if before.get(name) != mtime]
+    if not names or entry.exists():
+        return
+
+    tmp_entry = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_entry, ignore_errors=True)
+    tmp_entry.mkdir(parents=True)
+    for name in names:
+        _fast_copy(source_dir / name, tmp_entry / name)
+        shutil.copymode(source_dir / name, tmp_entry / name)
+    (tmp_entry / _SOURCE_DIR_FILE).write_bytes(os.fsencode(source_dir))
+    try:
+        os.rename(tmp_entry, entry)
+    except OSError:
+        # Another build stored the same entry first
+        shutil.rmtree(tmp_entry, ignore_errors=True)
+
+
+def _restore_generated_files(entry: Path, source_dir: Path) -> bool:
+    """Copy cached generated files into source_dir.
+
+    Outputs such as config.status embed the absolute directory configure
+    ran in; occurrences of the entry's original source_dir are rewritten
+    to the new one.
+
+    Returns:
+        True if a cache entry existed and was restored.
+    """
+    try:
+        with os.scandir(entry) as entries:
+            files = [e for e in entries if e.is_file() and e.name != _SOURCE_DIR_FILE]
+    except FileNotFoundError:
+        return False
+    try:
+        old_dir = (entry / _SOURCE_DIR_FILE).read_bytes()
+    except FileNotFoundError:
+        old_dir = None
+    new_dir = os.fsencode(source_dir)
+    # Restored files get fresh mtimes, keeping them newer than their inputs
+    for item in files:
+        dst = source_dir / item.name
+        data = Path(item.path).read_bytes()
+        if old_dir and old_dir != new_dir:
+            data = data.replace(old_dir, new_dir)
+        dst.write_bytes(data)
+        shutil.copymode(item.path, dst)
+    return True
+
+
+def _top_level_names(directory: Path) -> Set[str]:
+    """Return the names of the entries directly in directory."""
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
+
+
+def _compiler_env(ccache_dir: Optional[Path] = None) -> Dict[str, str]:
+    """Return the build environment, routing compiles through ccache if installed.
+
+    Explicit CC/CXX/CCACHE_DIR settings in the environment take precedence.
+    """
+    env = dict(os.environ)
+    if shutil.which("ccache"):
+        env.setdefault("CC", "ccache cc")
+        env.setdefault("CXX", "ccache c++")
+        if ccache_dir:
+            env.setdefault("CCACHE_DIR", str(ccache_dir))
+    return env
+
+
 def build_from_source(
     source_dir: Path,
     output_dir: Path,
@@ -210,6 +457,10 @@ def build_from_source(
     make_jobs: int = 4,
     clean: bool = False,
     build_script: str = "",
+    cache_dir: Optional[Path] = None,
+    ccache_dir: Optional[Path] = None,
+    stream: bool = True,
+    _paths_resolved: bool = False,
 ) -> Path:
     """Build MOO server from a source directory.
 
@@ -220,47 +471,78 @@ def build_from_source(
         make_jobs: Number of parallel make jobs.
         clean: If True, run make clean first.
         build_script: Custom build script to use instead of configure/make.
+        cache_dir: If set, reuse autoconf and configure outputs stored here
+            when their inputs are unchanged.
+        ccache_dir: CCACHE_DIR to use when ccache is available (unless
+            already set in the environment).
+        stream: If True, echo build output as it is produced; otherwise
+            it is captured and shown only on failure.
+        _paths_resolved: Internal; both directories are already absolute
+            and output_dir exists.
 
     Returns:
         Path to the built binary.
     """
-    source_dir = Path(source_dir).resolve()
-    output_dir = Path(output_dir).resolve()
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if not _paths_resolved:
+        source_dir, output_dir = _prepare_build_dirs(source_dir, output_dir)
 
     # Use custom build script if specified
     if build_script:
-        return build_with_script(source_dir, output_dir, build_script, make_jobs)
+        return build_with_script(
+            source_dir, output_dir, build_script, make_jobs,
+            stream=stream, _paths_resolved=True,
+        )
 
     # Standard autoconf/configure/make build
+    env = _compiler_env(ccache_dir)
+    top = _top_level_names(source_dir)
+
     # Clean if requested
-    if clean and (source_dir / "Makefile").exists():
+    if clean and "Makefile" in top:
         print("Running make clean...")
         run_cmd(["make", "clean"], cwd=source_dir)
 
     # Run autoconf if needed
-    if not (source_dir / "configure").exists():
-        if (source_dir / "configure.ac").exists():
-            print("Running autoconf...")
-            result = run_cmd(["autoconf"], cwd=source_dir)
-            if result.returncode != 0:
-                raise RuntimeError(f"autoconf failed: {result.stderr}")
+    if "configure" not in top:
+        if "configure.ac" in top:
+            entry = None
+            if cache_dir:
+                entry = cache_dir / "autoconf" / _autoconf_key(source_dir)
+            if entry and _restore_generated_files(entry, source_dir):
+                print("Using cached autoconf output")
+            else:
+                print("Running autoconf...")
+                before = _snapshot_files(source_dir)
+                result = run_cmd(["autoconf"], cwd=source_dir, stream=stream)
+                if result.returncode != 0:
+                    raise RuntimeError(f"autoconf failed: {result.stderr}")
+                if entry:
+                    _store_generated_files(source_dir, before, entry)
         else:
             raise RuntimeError(f"No configure script and no configure.ac in {source_dir}")
 
-    # Configure if needed
-    if not (source_dir / "Makefile").exists():
-        print("Running configure...")
-        configure_cmd = ["./configure"]
-        if configure_flags:
-            configure_cmd.extend(configure_flags.split())
-        result = run_cmd(configure_cmd, cwd=source_dir)
-        if result.returncode != 0:
-            raise RuntimeError(f"Configure failed: {result.stderr}")
+    # Configure if needed (autoconf never creates the Makefile)
+    if "Makefile" not in top:
+        entry = None
+        if cache_dir:
+            entry = cache_dir / "configure" / _configure_key(source_dir, configure_flags, env)
+        if entry and _restore_generated_files(entry, source_dir):
+            print("Using cached configure output")
+        else:
+            print("Running configure...")
+            configure_cmd = ["./configure"]
+            if configure_flags:
+                configure_cmd.extend(configure_flags.split())
+            before = _snapshot_files(source_dir)
+            result = run_cmd(configure_cmd, cwd=source_dir, env=env, stream=stream)
+            if result.returncode != 0:
+                raise RuntimeError(f"Configure failed: {result.stderr}")
+            if entry:
+                _store_generated_files(source_dir, before, entry)
 
     # Build
     print("Running make...")
-    result = run_cmd(["make", f"-j{make_jobs}"], cwd=source_dir)
+    result = run_cmd(["make", f"-j{make_jobs}"], cwd=source_dir, env=env, stream=stream)
     if result.returncode != 0:
         raise RuntimeError(f"Make failed: {result.stderr}")
 
@@ -271,13 +553,50 @@ def build_from_source(
 
     # Copy binary to output
     binary_dst = output_dir / "moo"
-    shutil.copy(binary_src, binary_dst)
+    _fast_copy(binary_src, binary_dst)
     binary_dst.chmod(0o755)
 
     print(f"Built binary: {binary_dst}")
     return binary_dst
 
 
+def _repo_build_settings(repo: str, config: Config) -> Tuple[str, int]:
+    """Return (build_script, fetch_depth) for a repository name or URL."""
+    if repo in config.repos:
+        repo_config = config.repos[repo]
+        return repo_config.build_script, repo_config.fetch_depth
+    return "", RepoConfig.fetch_depth
+
+
+def _build_config_flags(build_config: str, config: Config) -> str:
+    """Return the configure flags of a named build configuration."""
+    bc = get_build_config(build_config, config)
+    if bc is None:
+        available = ", ".join(config.get_build_config_map())
+        raise ValueError(f"Unknown build config: {build_config}. Available: {available}")
+    configure_flags = " ".join(bc.configure_flags)
+    print(f"Using build config '{build_config}': {configure_flags or '(default)'}")
+    return configure_flags
+
+
+def _deliver_cached_build(cached: Path, output_dir: Optional[Path]) -> Path:
+    """Copy a cached binary to output_dir if given and return its path."""
+    print(f"Using cached build: {cached}")
+    if not output_dir:
+        return cached
+    output_dir = Path(output_dir)
+    dst = output_dir / "moo"
+    try:
+        _fast_copy(cached, dst)
+    except FileNotFoundError:
+        if not cached.exists():
+            raise
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _fast_copy(cached, dst)
+    dst.chmod(0o755)
+    return dst
+
+
 def build_server(
     source_dir: Optional[Path] = None,
     repo: Optional[str] = None,
@@ -287,6 +606,8 @@ def build_server(
     build_config: Optional[str] = None,
     use_cache: bool = True,
     config: Optional[Config] = None,
+    update: bool = True,
+    stream: bool = True,
 ) -> Path:
     """Build a MOO server from source or repository.
 
@@ -299,6 +620,9 @@ def build_server(
         build_config: Named build configuration (e.g., "waterpoint", "i64_unicode").
         use_cache: If True, use build caching.
         config: Configuration object (default: load from files).
+        update: If True, fetch repository updates before building.
+        stream: If True, echo build output as it is produced; otherwise
+            it is captured and shown only on failure.
 
     Returns:
         Path to the built binary.
@@ -313,78 +637,82 @@ def build_server(
 
     # Resolve configure flags from build_config if specified
     if build_config and not configure_flags:
-        bc = get_build_config(build_config, config)
-        if bc is None:
-            available = ", ".join(config.build_configs.keys())
-            raise ValueError(f"Unknown build config: {build_config}. Available: {available}")
-        configure_flags = " ".join(bc.configure_flags)
-        print(f"Using build config '{build_config}': {configure_flags or '(default)'}")
+        configure_flags = _build_config_flags(build_config, config)
 
     # Handle repository-based build
     if repo:
         repo_url = resolve_repo_url(repo)
 
-        # Get build script from repo config if this is a known repo
-        build_script = ""
-        if repo in config.repos:
-            repo_config = config.repos[repo]
-            build_script = repo_config.build_script
-
-        # Get the repository
-        repo_path = get_or_clone_repo(
-            repo,
-            config.repo_cache_dir,
-            ref=ref,
-            update=True,
-        )
+        build_script, fetch_depth = _repo_build_settings(repo, config)
+
+        # Hold the repo lock until the hash is read so a concurrent build
+        # of another ref cannot move HEAD in between
+        with repo_lock(repo):
+            repo_path = get_or_clone_repo(
+                repo,
+                config.repo_cache_dir,
+                ref=ref,
+                update=update,
+                depth=fetch_depth,
+                fetch_ttl=config.fetch_ttl,
+            )
 
-        # Get commit hash for caching
-        commit_hash = get_commit_hash(repo_path)
+            # Get commit hash for caching
+            commit_hash = get_commit_hash(repo_path)
 
         # Check cache
         if use_cache:
             cached = get_cached_build(config, repo_url, commit_hash, configure_flags)
             if cached:
-                print(f"Using cached build: {cached}")
-                if output_dir:
-                    output_dir = Path(output_dir)
-                    output_dir.mkdir(parents=True, exist_ok=True)
-                    dst = output_dir / "moo"
-                    shutil.copy(cached, dst)
-                    dst.chmod(0o755)
-                    return dst
-                return cached
+                return _deliver_cached_build(cached, output_dir)
 
         # Build in a temporary directory to avoid polluting the repo
         with tempfile.TemporaryDirectory(prefix="moo_build_") as tmpdir:
             work_dir = Path(tmpdir) / "build"
-            shutil.copytree(repo_path, work_dir)
-
-            # Determine output location
-            if output_dir:
-                build_output = Path(output_dir)
-            else:
-                build_output = Path(tmpdir) / "output"
-
-            binary = build_from_source(
-                work_dir,
-                build_output,
-                configure_flags=configure_flags,
-                make_jobs=config.make_jobs,
-                build_script=build_script,
-            )
-
-            # Cache the build
-            if use_cache:
-                cached = cache_build(config, binary, repo_url, commit_hash, configure_flags)
-                print(f"Cached build at: {cached}")
-
-            # Copy to final output if needed
-            if output_dir:
-                return binary
-            else:
-                # If no output_dir specified, return cached location
-                return cached if use_cache else binary
+            # A worktree avoids copying the tree; fall back for non-git caches
+            with repo_lock(repo):
+                worktree = add_worktree(repo_path, work_dir, commit_hash)
+            if not worktree:
+                shutil.rmtree(work_dir, ignore_errors=True)
+                fast_clone_tree(repo_path, work_dir)
+
+            try:
+                # Determine output location
+                if output_dir:
+                    build_output = Path(output_dir)
+                else:
+                    build_output = Path(tmpdir) / "output"
+                work_dir, build_output = _prepare_build_dirs(work_dir, build_output)
+
+                binary = build_from_source(
+                    work_dir,
+                    build_output,
+                    configure_flags=configure_flags,
+                    make_jobs=config.make_jobs,
+                    # A copied tree may carry build outputs from the cache
+                    clean=not worktree,
+                    build_script=build_script,
+                    cache_dir=config.build_state_dir / "configure" if use_cache else None,
+                    ccache_dir=config.build_state_dir / "ccache",
+                    stream=stream,
+                    _paths_resolved=True,
+                )
+
+                # Cache the build
+                if use_cache:
+                    cached = cache_build(config, binary, repo_url, commit_hash, configure_flags)
+                    print(f"Cached build at: {cached}")
+
+                # Copy to final output if needed
+                if output_dir:
+                    return binary
+                else:
+                    # If no output_dir specified, return cached location
+                    return cached if use_cache else binary
+            finally:
+                if worktree:
+                    with repo_lock(repo):
+                        remove_worktree(repo_path, work_dir)
 
     else:
         # Local source build
@@ -396,11 +724,160 @@ def build_server(
             output_dir,
             configure_flags=configure_flags,
             make_jobs=config.make_jobs,
+            ccache_dir=config.build_state_dir / "ccache",
+            stream=stream,
         )
 
 
+@dataclass
+class BuildSpec:
+    """One repository build request for build_many()."""
+    repo: str
+    ref: Optional[str] = None
+    build_config: Optional[str] = None
+    configure_flags: str = ""
+    output_dir: Optional[Path] = None
+
+
+def _build_checkout(
+    work_dir: Path,
+    output_dir: Path,
+    configure_flags: str,
+    build_script: str,
+    make_jobs: int,
+    clean: bool,
+    cache_dir: Optional[Path],
+    ccache_dir: Path,
+) -> Path:
+    """build_many() worker: build a tree the parent process checked out."""
+    return build_from_source(
+        work_dir,
+        output_dir,
+        configure_flags=configure_flags,
+        make_jobs=make_jobs,
+        clean=clean,
+        build_script=build_script,
+        cache_dir=cache_dir,
+        ccache_dir=ccache_dir,
+        stream=False,
+    )
+
+
+def build_many(
+    specs: List[BuildSpec],
+    config: Optional[Config] = None,
+    max_parallel: int = 2,
+    use_cache: bool = True,
+) -> List[Path]:
+    """Build several repository configurations in parallel processes.
+
+    All git work happens in this process: each (repo, ref) is checked out
+    once, and every build that is not already cached gets its own worktree
+    before it is submitted. Workers only run configure and make in their
+    worktree, and their binaries are added to the build cache here, so the
+    shared clone and the build index are never written by two processes.
+    make_jobs is divided between the parallel builds, and build output is
+    captured rather than streamed.
+
+    Args:
+        specs: Builds to run.
+        config: Configuration object (default: load from files).
+        max_parallel: Maximum number of concurrent builds.
+        use_cache: If True, use build caching.
+
+    Returns:
+        Paths to the built binaries, in the same order as specs.
+    """
+    if config is None:
+        config = get_config()
+
+    make_jobs = max(1, config.make_jobs // max_parallel)
+    configure_cache = config.build_state_dir / "configure" if use_cache else None
+    ccache_dir = config.build_state_dir / "ccache"
+
+    results: List[Optional[Path]] = [None] * len(specs)
+    # index -> (repo_url, commit_hash, configure_flags, work_dir, output_dir, copied)
+    pending: Dict[int, Tuple[str, str, str, Path, Path, bool]] = {}
+    worktrees: List[Tuple[str, Path, Path]] = []
+
+    with tempfile.TemporaryDirectory(prefix="moo_build_") as tmpdir:
+        try:
+            commits: Dict[Tuple[str, Optional[str]], Tuple[Path, str]] = {}
+            for index, spec in enumerate(specs):
+                configure_flags = spec.configure_flags
+                if spec.build_config and not configure_flags:
+                    configure_flags = _build_config_flags(spec.build_config, config)
+                repo_url = resolve_repo_url(spec.repo)
+
+                with repo_lock(spec.repo):
+                    key = (spec.repo, spec.ref)
+                    if key not in commits:
+                        _, fetch_depth = _repo_build_settings(spec.repo, config)
+                        repo_path = get_or_clone_repo(
+                            spec.repo,
+                            config.repo_cache_dir,
+                            ref=spec.ref,
+                            update=True,
+                            depth=fetch_depth,
+                            fetch_ttl=config.fetch_ttl,
+                        )
+                        commits[key] = (repo_path, get_commit_hash(repo_path))
+                    repo_path, commit_hash = commits[key]
+
+                    if use_cache:
+                        cached = get_cached_build(config, repo_url, commit_hash, configure_flags)
+                        if cached:
+                            results[index] = _deliver_cached_build(cached, spec.output_dir)
+                            continue
+
+                    work_dir = Path(tmpdir) / f"build{index}"
+                    copied = not add_worktree(repo_path, work_dir, commit_hash)
+                    if copied:
+                        shutil.rmtree(work_dir, ignore_errors=True)
+                        fast_clone_tree(repo_path, work_dir)
+                    else:
+                        worktrees.append((spec.repo, repo_path, work_dir))
+
+                output_dir = Path(spec.output_dir or Path(tmpdir) / f"output{index}")
+                work_dir, output_dir = _prepare_build_dirs(work_dir, output_dir)
+                pending[index] = (repo_url, commit_hash, configure_flags, work_dir, output_dir, copied)
+
+            with ProcessPoolExecutor(max_workers=max_parallel) as executor:
+                futures = {
+                    index: executor.submit(
+                        _build_checkout,
+                        work_dir,
+                        output_dir,
+                        configure_flags,
+                        _repo_build_settings(specs[index].repo, config)[0],
+                        make_jobs,
+                        copied,
+                        configure_cache,
+                        ccache_dir,
+                    )
+                    for index, (_, _, configure_flags, work_dir, output_dir, copied)
+                    in pending.items()
+                }
+                for index, future in futures.items():
+                    binary = future.result()
+                    repo_url, commit_hash, configure_flags = pending[index][:3]
+                    if use_cache:
+                        cached = cache_build(config, binary, repo_url, commit_hash, configure_flags)
+                        print(f"Cached build at: {cached}")
+                        binary = binary if specs[index].output_dir else cached
+                    results[index] = binary
+        finally:
+            for repo, repo_path, work_dir in worktrees:
+                with repo_lock(repo):
+                    remove_worktree(repo_path, work_dir)
+
+    return results
+
+
 def main():
     """Main entry point for moo-build command."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Build MOO server binary from source or repository",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -460,7 +937,8 @@ Build configurations (for --config):
     parser.add_argument(
         "--config",
         dest="build_config",
-        help="Named build configuration (e.g., waterpoint, i64_unicode)"
+        help="Named build configuration (e.g., waterpoint, i64_unicode); "
+             "a comma-separated list builds each in parallel"
     )
     parser.add_argument(
         "--configure-flags",
@@ -506,6 +984,31 @@ Build configurations (for --config):
     if not args.source and not args.repo:
         parser.error("Must specify --source or --repo")
 
+    if args.build_config and "," in args.build_config:
+        if not args.repo:
+            parser.error("Multiple --config values require --repo")
+        if args.configure_flags:
+            parser.error("--configure-flags cannot be combined with multiple --config values")
+        names = [name.strip() for name in args.build_config.split(",") if name.strip()]
+        specs = [
+            BuildSpec(
+                repo=args.repo,
+                ref=args.ref,
+                build_config=name,
+                output_dir=args.output / name if args.output else None,
+            )
+            for name in names
+        ]
+        try:
+            binaries = build_many(specs, get_config(), use_cache=not args.no_cache)
+        except Exception as e:
+            print(f"\nError: {e}")
+            return 1
+        print()
+        for name, binary in zip(names, binaries):
+            print(f"Success: {name}: {binary}")
+        return 0
+
     try:
         binary = build_server(
             source_dir=args.source,
@@ -0,0 +1,126 @@
+"""Manifest of cached server builds.
+
+The build cache stores one directory per build hash. ``BuildIndex`` keeps a
+JSON manifest (``.cache/index.json``) alongside those directories so cache
+lookups are dictionary hits instead of a stat() per probe.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Subdirectory of the build cache holding harness state (the manifest,
+# configure outputs, ccache) rather than builds; cache listings skip it
+STATE_DIRNAME = ".cache"
+
+
+class BuildIndex:
+    """JSON-backed map of build hash to cached binary.
+
+    The manifest is loaded lazily and validated against the cache directory
+    once, so entries whose directories were removed (e.g. by ``moo-clean``)
+    are dropped. Builds cached before the manifest existed are picked up by
+    a stat() fallback on a miss.
+    """
+
+    FILENAME = "index.json"
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.path = self.cache_dir / STATE_DIRNAME / self.FILENAME
+        # Where the manifest lived before it moved under STATE_DIRNAME
+        self._legacy_path = self.cache_dir / self.FILENAME
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {"cache_dir": self.cache_dir}
+
+    def __setstate__(self, state):
+        self.__init__(state["cache_dir"])
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            try:
+                data = json.loads(self._legacy_path.read_text())
+            except (FileNotFoundError, ValueError):
+                return {}
+        except ValueError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            build_hash: entry
+            for build_hash, entry in data.items()
+            if isinstance(entry, dict) and "path" in entry
+        }
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the manifest from disk, dropping entries no longer present.
+
+        Returns:
+            Mapping of build hash to entry (``path`` and ``mtime``).
+        """
+        entries = self._read()
+        try:
+            with os.scandir(self.cache_dir) as it:
+                present = {entry.name for entry in it}
+        except FileNotFoundError:
+            present = set()
+        self._entries = {h: e for h, e in entries.items() if h in present}
+        return self._entries
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Return all known cache entries."""
+        if self._entries is None:
+            return self.load()
+        return self._entries
+
+    def get(self, build_hash: str) -> Optional[Path]:
+        """Look up the cached binary for a build hash.
+
+        Args:
+            build_hash: Hash from ``compute_build_hash``.
+
+        Returns:
+            Path to the cached binary, or None if not cached.
+        """
+        entry = self.entries().get(build_hash)
+        if entry:
+            return Path(entry["path"])
+
+        binary = self.cache_dir / build_hash / "moo"
+        if binary.is_file():
+            self.add(build_hash, binary)
+            return binary
+        return None
+
+    def add(self, build_hash: str, binary: Path) -> None:
+        """Record a cached binary and persist the manifest.
+
+        The on-disk manifest is merged in first so that entries written by
+        other processes sharing the cache are kept.
+
+        Args:
+            build_hash: Hash from ``compute_build_hash``.
+            binary: Path to the cached binary.
+        """
+        with self._lock:
+            entries = self._read()
+            entries.update(self.entries())
+            entries[build_hash] = {
+                "path": str(binary),
+                "mtime": binary.stat().st_mtime,
+            }
+            self._entries = entries
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.FILENAME}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(entries, indent=2, sort_keys=True))
+            os.replace(tmp_path, self.path)
+            self._legacy_path.unlink(missing_ok=True)
@@ -4,11 +4,13 @@
 This module provides commands to clean up cached repositories and builds.
 """
 
-import argparse
+import os
 import shutil
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from .config import get_config
 
@@ -23,88 +25,163 @@ def get_cache_info(cache_dir: Path) -> List[Tuple[Path, int]]:
         List of (path, size_bytes) tuples.
     """
     items = []
-    if not cache_dir.exists():
+    dirs = []
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                # Dot entries hold harness state (e.g. builds/.cache), not items
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    dirs.append(Path(entry.path))
+                elif entry.is_file():
+                    items.append((Path(entry.path), entry.stat().st_size))
+    except FileNotFoundError:
         return items
 
-    for item in cache_dir.iterdir():
-        if item.is_dir():
-            # Calculate directory size
-            size = sum(f.stat().st_size for f in item.rglob('*') if f.is_file())
-            items.append((item, size))
-        elif item.is_file():
-            items.append((item, item.stat().st_size))
+    # Directory sizing is dominated by filesystem latency; overlap it
+    if dirs:
+        with ThreadPoolExecutor(max_workers=min(32, len(dirs))) as executor:
+            items.extend(zip(dirs, executor.map(_dir_size, dirs)))
 
     return sorted(items, key=lambda x: x[0].name)
 
 
+def get_state_info(config) -> List[Tuple[Path, int]]:
+    """Get the harness state directory of the build cache, if present.
+
+    builds/.cache holds the build index, the configure cache and ccache. It is
+    left out of get_cache_info() so it is not listed as a build, but it is
+    reported and cleaned along with the build cache.
+
+    Args:
+        config: Harness configuration.
+
+    Returns:
+        A list with one (path, size_bytes) tuple, or an empty list.
+    """
+    state_dir = config.build_state_dir
+    if not state_dir.is_dir():
+        return []
+    return [(state_dir, _dir_size(state_dir))]
+
+
+def _dir_size(path) -> int:
+    """Return the total size of regular files below path.
+
+    Files or directories that disappear (or are unreadable) while the tree
+    is being walked are skipped rather than aborting the listing.
+    """
+    total = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        total += _dir_size(entry.path)
+                except FileNotFoundError:
+                    continue
+    except (FileNotFoundError, PermissionError):
+        pass
+    return total
+
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+_THRESHOLDS = tuple(1024 ** i for i in range(len(_UNITS)))
+
+
 def format_size(size_bytes: int) -> str:
     """Format a size in bytes to human-readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    i = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_UNITS) - 1)
+    return f"{size_bytes / _THRESHOLDS[i]:.1f} {_UNITS[i]}"
 
 
-def clean_directory(cache_dir: Path, dry_run: bool = False) -> Tuple[int, int]:
+def clean_directory(
+    cache_dir: Path,
+    dry_run: bool = False,
+    items: Optional[List[Tuple[Path, int]]] = None,
+) -> Tuple[int, int]:
     """Clean a cache directory.
 
     Args:
         cache_dir: Path to cache directory.
         dry_run: If True, only report what would be deleted.
+        items: Result of get_cache_info(cache_dir) if the caller already
+            has it; avoids walking the cache a second time.
 
     Returns:
         Tuple of (items_removed, bytes_freed).
     """
-    if not cache_dir.exists():
-        return 0, 0
-
-    items = get_cache_info(cache_dir)
+    if items is None:
+        if not cache_dir.exists():
+            return 0, 0
+        items = get_cache_info(cache_dir)
     total_items = len(items)
     total_bytes = sum(size for _, size in items)
 
     if dry_run:
         return total_items, total_bytes
 
-    # Actually delete
-    for item, _ in items:
-        if item.is_dir():
-            shutil.rmtree(item, ignore_errors=True)
-        else:
-            item.unlink(missing_ok=True)
+    _remove_paths([item for item, _ in items])
 
     return total_items, total_bytes
 
 
+# Paths per rm invocation, keeping argv well below ARG_MAX
+_RM_BATCH = 512
+
+
+def _remove_paths(paths: List[Path]) -> None:
+    """Delete files and directory trees, ignoring ones that are already gone.
+
+    On POSIX systems this hands each batch to a single ``rm -rf`` process
+    rather than walking every tree from Python.
+    """
+    if os.name == "posix" and shutil.which("rm"):
+        for start in range(0, len(paths), _RM_BATCH):
+            batch = [str(p) for p in paths[start:start + _RM_BATCH]]
+            subprocess.run(["rm", "-rf", "--", *batch], check=False)
+        return
+
+    for path in paths:
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+
+
 def list_cache_contents(config=None):
     """List contents of all cache directories."""
     if config is None:
         config = get_config()
 
-    print("Cache Contents")
-    print("=" * 60)
+    # Build the whole report and write it once rather than print per line
+    lines = ["Cache Contents", "=" * 60]
 
     # Repo cache
-    print(f"\nRepository Cache: {config.repo_cache_dir}")
+    lines.append(f"\nRepository Cache: {config.repo_cache_dir}")
     if config.repo_cache_dir.exists():
         items = get_cache_info(config.repo_cache_dir)
         if items:
             total = 0
             for path, size in items:
-                print(f"  {path.name:30} {format_size(size):>10}")
+                lines.append(f"  {path.name:30} {format_size(size):>10}")
                 total += size
-            print(f"  {'─' * 42}")
-            print(f"  {'Total':30} {format_size(total):>10}")
+            lines.append(f"  {'─' * 42}")
+            lines.append(f"  {'Total':30} {format_size(total):>10}")
         else:
-            print("  (empty)")
+            lines.append("  (empty)")
     else:
-        print("  (not created)")
+        lines.append("  (not created)")
 
     # Build cache
-    print(f"\nBuild Cache: {config.build_cache_dir}")
+    lines.append(f"\nBuild Cache: {config.build_cache_dir}")
     if config.build_cache_dir.exists():
         items = get_cache_info(config.build_cache_dir)
-        if items:
+        state = get_state_info(config)
+        if items or state:
             total = 0
             for path, size in items:
                 # Try to read build info
@@ -121,18 +198,26 @@ def list_cache_contents(config=None):
                                 break
                     except Exception:
                         pass
-                print(f"  {path.name}{desc:20} {format_size(size):>10}")
+                lines.append(f"  {path.name}{desc:20} {format_size(size):>10}")
+                total += size
+            for path, size in state:
+                lines.append(f"  {'harness state (' + path.name + ')':30} {format_size(size):>10}")
                 total += size
-            print(f"  {'─' * 42}")
-            print(f"  {'Total':30} {format_size(total):>10}")
+            lines.append(f"  {'─' * 42}")
+            lines.append(f"  {'Total':30} {format_size(total):>10}")
         else:
-            print("  (empty)")
+            lines.append("  (empty)")
     else:
-        print("  (not created)")
+        lines.append("  (not created)")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 
 def main():
     """Main entry point for moo-clean command."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Clean LambdaMOO test suite caches",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -210,17 +295,16 @@ Cache Locations:
     clean_repos = args.all or args.repos
     clean_builds = args.all or args.builds
 
-    # Calculate what would be cleaned
-    repos_items, repos_bytes = 0, 0
-    builds_items, builds_bytes = 0, 0
-
-    if clean_repos:
-        repos_items, repos_bytes = get_cache_info_totals(config.repo_cache_dir)
-    if clean_builds:
-        builds_items, builds_bytes = get_cache_info_totals(config.build_cache_dir)
+    # Calculate what would be cleaned; the listings are reused for deletion
+    repos_info = get_cache_info(config.repo_cache_dir) if clean_repos else []
+    builds_info = get_cache_info(config.build_cache_dir) if clean_builds else []
+    state_info = get_state_info(config) if clean_builds else []
+    repos_items, repos_bytes = len(repos_info), sum(size for _, size in repos_info)
+    builds_items, builds_bytes = len(builds_info), sum(size for _, size in builds_info)
+    state_bytes = sum(size for _, size in state_info)
 
-    total_items = repos_items + builds_items
-    total_bytes = repos_bytes + builds_bytes
+    total_items = repos_items + builds_items + len(state_info)
+    total_bytes = repos_bytes + builds_bytes + state_bytes
 
     if total_items == 0:
         print("Nothing to clean.")
@@ -232,6 +316,8 @@ Cache Locations:
         print(f"  Repository cache: {repos_items} items, {format_size(repos_bytes)}")
     if clean_builds and builds_items > 0:
         print(f"  Build cache:      {builds_items} items, {format_size(builds_bytes)}")
+    if state_info:
+        print(f"  Harness state:    {format_size(state_bytes)}")
     print(f"  Total:            {total_items} items, {format_size(total_bytes)}")
 
     if args.dry_run:
@@ -251,14 +337,17 @@ Cache Locations:
 
     # Actually clean
     if clean_repos:
-        items, bytes_freed = clean_directory(config.repo_cache_dir)
+        items, bytes_freed = clean_directory(config.repo_cache_dir, items=repos_info)
         if items > 0:
             print(f"Cleaned repository cache: {items} items, {format_size(bytes_freed)}")
 
     if clean_builds:
-        items, bytes_freed = clean_directory(config.build_cache_dir)
+        items, bytes_freed = clean_directory(config.build_cache_dir, items=builds_info)
         if items > 0:
             print(f"Cleaned build cache: {items} items, {format_size(bytes_freed)}")
+        if state_info:
+            clean_directory(config.build_state_dir, items=state_info)
+            print(f"Cleaned harness state: {format_size(state_bytes)}")
 
     print("Done.")
     return 0
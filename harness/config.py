@@ -13,17 +13,24 @@ Configuration is loaded from (in order of precedence):
 4. Built-in defaults
 """
 
+import dataclasses
 import os
+from collections import ChainMap
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Any, List
+from types import MappingProxyType
+from typing import Dict, Optional, Any, List, Mapping, Tuple
 
-# Try to import tomllib (Python 3.11+) or tomli as fallback
+from .build_index import STATE_DIRNAME, BuildIndex
+from .repos import derive_repo_dirname
+
+# Prefer tomli when installed (its wheels are mypyc-compiled and parse faster
+# than the pure-Python stdlib tomllib), then tomllib (Python 3.11+)
 try:
-    import tomllib
+    import tomli as tomllib
 except ImportError:
     try:
-        import tomli as tomllib
+        import tomllib
     except ImportError:
         tomllib = None
 
@@ -32,81 +39,85 @@ except ImportError:
 class BuildConfig:
     """A named build configuration with specific configure flags."""
     name: str
-    configure_flags: List[str]
+    configure_flags: Tuple[str, ...]
     description: str = ""
 
+    def __post_init__(self):
+        # Tuples let predefined configs be shared without defensive copies
+        self.configure_flags = tuple(self.configure_flags)
+
 
 # Predefined build configurations for LambdaMOO
 # These map to ./configure options in the main lambdamoo repo
-PREDEFINED_BUILD_CONFIGS: Dict[str, BuildConfig] = {
+PREDEFINED_BUILD_CONFIGS: Mapping[str, BuildConfig] = MappingProxyType({
     "default": BuildConfig(
         name="default",
-        configure_flags=[],
+        configure_flags=(),
         description="Default build with no extra options",
     ),
     "i32": BuildConfig(
         name="i32",
-        configure_flags=["--enable-sz=i32"],
+        configure_flags=("--enable-sz=i32",),
         description="Explicit 32-bit integers (for testing overflow behavior)",
     ),
     "i64": BuildConfig(
         name="i64",
-        configure_flags=["--enable-sz=i64"],
+        configure_flags=("--enable-sz=i64",),
         description="64-bit integers",
     ),
     "i64_unicode": BuildConfig(
         name="i64_unicode",
-        configure_flags=["--enable-sz=i64", "--enable-unicode"],
+        configure_flags=("--enable-sz=i64", "--enable-unicode"),
         description="64-bit integers + Unicode strings",
     ),
     "i64_xml": BuildConfig(
         name="i64_xml",
-        configure_flags=["--enable-sz=i64", "--enable-xml"],
+        configure_flags=("--enable-sz=i64", "--enable-xml"),
         description="64-bit integers + XML support",
     ),
     "i64_waifs": BuildConfig(
         name="i64_waifs",
-        configure_flags=["--enable-sz=i64", "--enable-waifs=dict"],
+        configure_flags=("--enable-sz=i64", "--enable-waifs=dict"),
         description="64-bit integers + Waifs with dict syntax",
     ),
     "i64_unicode_waifs": BuildConfig(
         name="i64_unicode_waifs",
-        configure_flags=["--enable-sz=i64", "--enable-unicode", "--enable-waifs=dict"],
+        configure_flags=("--enable-sz=i64", "--enable-unicode", "--enable-waifs=dict"),
         description="64-bit integers + Unicode + Waifs",
     ),
     "waterpoint": BuildConfig(
         name="waterpoint",
-        configure_flags=[
+        configure_flags=(
             "--enable-sz=i64",
             "--enable-unicode",
             "--enable-xml",
             "--enable-waifs=dict",
             "--enable-def-BITWISE_OPERATORS",
-        ],
+        ),
         description="Full Waterpoint config (i64 + unicode + xml + waifs + bitwise)",
     ),
     "full": BuildConfig(
         name="full",
-        configure_flags=[
+        configure_flags=(
             "--enable-sz=i64",
             "--enable-unicode",
             "--enable-xml",
             "--enable-waifs=dict",
             "--enable-def-BITWISE_OPERATORS",
-        ],
+        ),
         description="Full feature set (alias for waterpoint)",
     ),
     "bitwise": BuildConfig(
         name="bitwise",
-        configure_flags=["--enable-def-BITWISE_OPERATORS"],
+        configure_flags=("--enable-def-BITWISE_OPERATORS",),
         description="Default build with bitwise operators enabled",
     ),
     "i64_bitwise": BuildConfig(
         name="i64_bitwise",
-        configure_flags=["--enable-sz=i64", "--enable-def-BITWISE_OPERATORS"],
+        configure_flags=("--enable-sz=i64", "--enable-def-BITWISE_OPERATORS"),
         description="64-bit integers with bitwise operators",
     ),
-}
+})
 
 
 @dataclass
@@ -122,6 +133,26 @@ class RepoConfig:
     # Known features for repos that don't report them via server_version
     # List of: i64, unicode, xml, waifs, waif_dict
     known_features: List[str] = field(default_factory=list)
+    # Git history depth for the cached clone (0 = full history)
+    fetch_depth: int = 1
+    # Directory name of the cached clone, derived from url
+    dirname: str = field(init=False, default="")
+
+    def __post_init__(self):
+        self.dirname = derive_repo_dirname(self.url)
+
+
+# Resolved once; Path.home() re-reads the environment on every call
+_HOME = Path(os.path.expanduser("~"))
+_CACHE_ROOT = _HOME / ".cache" / "lambdamoo-tests"
+
+
+def _expand_path(value) -> Path:
+    """Convert a path setting to a Path, expanding a leading ~."""
+    text = os.fspath(value)
+    if text.startswith("~"):
+        return Path(os.path.expanduser(text))
+    return value if isinstance(value, Path) else Path(text)
 
 
 @dataclass
@@ -129,13 +160,13 @@ class Config:
     """Main configuration for the test suite."""
 
     # Directory for caching cloned repositories
-    repo_cache_dir: Path = field(default_factory=lambda: Path.home() / ".cache" / "lambdamoo-tests" / "repos")
+    repo_cache_dir: Path = field(default_factory=lambda: _CACHE_ROOT / "repos")
 
     # Directory for caching built binaries
-    build_cache_dir: Path = field(default_factory=lambda: Path.home() / ".cache" / "lambdamoo-tests" / "builds")
+    build_cache_dir: Path = field(default_factory=lambda: _CACHE_ROOT / "builds")
 
     # Directory for test databases (auto-generated, server-scoped)
-    database_dir: Path = field(default_factory=lambda: Path.home() / ".cache" / "lambdamoo-tests" / "databases")
+    database_dir: Path = field(default_factory=lambda: _CACHE_ROOT / "databases")
 
     # Path to Minimal.db (if known)
     minimal_db: Optional[Path] = None
@@ -146,7 +177,7 @@ class Config:
     # Known repositories
     repos: Dict[str, RepoConfig] = field(default_factory=dict)
 
-    # Named build configurations
+    # Named build configurations, in addition to PREDEFINED_BUILD_CONFIGS
     build_configs: Dict[str, BuildConfig] = field(default_factory=dict)
 
     # Default configure flags for builds
@@ -155,27 +186,18 @@ class Config:
     # Number of parallel jobs for make
     make_jobs: int = 4
 
+    # Seconds after a fetch during which cached repos are not re-fetched
+    fetch_ttl: float = 300
+
+    # Fields normalized to Path in __post_init__ (not a dataclass field)
+    _PATH_FIELDS = ("repo_cache_dir", "build_cache_dir", "database_dir", "minimal_db", "moo_binary")
+
     def __post_init__(self):
-        # Ensure paths are Path objects
-        if isinstance(self.repo_cache_dir, str):
-            self.repo_cache_dir = Path(self.repo_cache_dir)
-        if isinstance(self.build_cache_dir, str):
-            self.build_cache_dir = Path(self.build_cache_dir)
-        if isinstance(self.database_dir, str):
-            self.database_dir = Path(self.database_dir)
-        if isinstance(self.minimal_db, str):
-            self.minimal_db = Path(self.minimal_db)
-        if isinstance(self.moo_binary, str):
-            self.moo_binary = Path(self.moo_binary)
-
-        # Expand ~ in paths
-        self.repo_cache_dir = self.repo_cache_dir.expanduser()
-        self.build_cache_dir = self.build_cache_dir.expanduser()
-        self.database_dir = self.database_dir.expanduser()
-        if self.minimal_db:
-            self.minimal_db = self.minimal_db.expanduser()
-        if self.moo_binary:
-            self.moo_binary = self.moo_binary.expanduser()
+        # Ensure paths are Path objects with ~ expanded
+        for name in self._PATH_FIELDS:
+            value = getattr(self, name)
+            if value:
+                setattr(self, name, _expand_path(value))
 
         # Add default known repos if not overridden
         if "lambdamoo" not in self.repos:
@@ -194,26 +216,60 @@ class Config:
                 known_features=["i64", "unicode", "xml", "waifs", "waif_dict", "bitwise"],
             )
 
-        # Add predefined build configs if not overridden
-        for name, config in PREDEFINED_BUILD_CONFIGS.items():
-            if name not in self.build_configs:
-                self.build_configs[name] = config
+    def get_build_config_map(self) -> ChainMap:
+        """All build configs by name; entries in build_configs take precedence."""
+        return ChainMap(self.build_configs, PREDEFINED_BUILD_CONFIGS)
+
+    @property
+    def build_state_dir(self) -> Path:
+        """Harness state kept in the build cache but not listed as builds."""
+        return self.build_cache_dir / STATE_DIRNAME
+
+    @property
+    def build_index(self) -> BuildIndex:
+        """Manifest of cached builds in build_cache_dir."""
+        index = self.__dict__.get("_build_index")
+        if index is None or index.cache_dir != self.build_cache_dir:
+            index = BuildIndex(self.build_cache_dir)
+            self.__dict__["_build_index"] = index
+        return index
 
 
 # Default configuration file locations
-USER_CONFIG_PATH = Path.home() / ".config" / "lambdamoo-tests" / "config.toml"
+USER_CONFIG_PATH = _HOME / ".config" / "lambdamoo-tests" / "config.toml"
 PROJECT_CONFIG_NAME = ".moo-tests.toml"
 
 
+# (cwd, result) of the last _find_project_config() walk
+_cached_project_config: Optional[Tuple[str, Optional[Path]]] = None
+
+
 def _find_project_config() -> Optional[Path]:
-    """Find project-local config file by walking up from cwd."""
-    current = Path.cwd()
-    while current != current.parent:
-        config_path = current / PROJECT_CONFIG_NAME
-        if config_path.exists():
-            return config_path
-        current = current.parent
-    return None
+    """Find project-local config file by walking up from cwd.
+
+    Each ancestor costs a single stat() of the candidate path. Listing the
+    ancestors with os.scandir would read every entry of directories such as
+    $HOME to answer the same question, so it is deliberately not used.
+
+    The result is cached per working directory; reset_config() clears it.
+    """
+    global _cached_project_config
+    cwd = os.getcwd()
+    if _cached_project_config is not None and _cached_project_config[0] == cwd:
+        return _cached_project_config[1]
+
+    result = None
+    current = cwd
+    parent = os.path.dirname(current)
+    while current != parent:
+        candidate = os.path.join(current, PROJECT_CONFIG_NAME)
+        if os.path.isfile(candidate):
+            result = Path(candidate)
+            break
+        current, parent = parent, os.path.dirname(parent)
+
+    _cached_project_config = (cwd, result)
+    return result
 
 
 def _load_toml(path: Path) -> Dict[str, Any]:
@@ -227,6 +283,10 @@ def _load_toml(path: Path) -> Dict[str, Any]:
         return tomllib.load(f)
 
 
+# RepoConfig fields that may be set from a [repos.<name>] table
+_REPO_FIELDS = frozenset(f.name for f in dataclasses.fields(RepoConfig) if f.init)
+
+
 def _parse_repos(repos_dict: Dict[str, Any]) -> Dict[str, RepoConfig]:
     """Parse repos section from config file."""
     result = {}
@@ -235,14 +295,25 @@ def _parse_repos(repos_dict: Dict[str, Any]) -> Dict[str, RepoConfig]:
             # Simple URL string
             result[name] = RepoConfig(url=info)
         elif isinstance(info, dict):
-            result[name] = RepoConfig(
-                url=info.get("url", ""),
-                default_branch=info.get("default_branch", "master"),
-                configure_flags=info.get("configure_flags", ""),
-            )
+            settings = {k: v for k, v in info.items() if k in _REPO_FIELDS}
+            settings.setdefault("url", "")
+            result[name] = RepoConfig(**settings)
     return result
 
 
+# Environment variable -> (Config attribute, converter)
+_ENV_HANDLERS = {
+    "MOO_REPO_CACHE_DIR": ("repo_cache_dir", _expand_path),
+    "MOO_BUILD_CACHE_DIR": ("build_cache_dir", _expand_path),
+    "MOO_DATABASE_DIR": ("database_dir", _expand_path),
+    "MOO_MINIMAL_DB": ("minimal_db", _expand_path),
+    "MOO_BINARY": ("moo_binary", _expand_path),
+    "MOO_CONFIGURE_FLAGS": ("default_configure_flags", str),
+    "MOO_MAKE_JOBS": ("make_jobs", int),
+    "MOO_FETCH_TTL": ("fetch_ttl", float),
+}
+
+
 def load_config() -> Config:
     """Load configuration from files and environment.
 
@@ -266,16 +337,9 @@ def load_config() -> Config:
         # Paths section
         if "paths" in data:
             paths = data["paths"]
-            if "repo_cache_dir" in paths:
-                config.repo_cache_dir = Path(paths["repo_cache_dir"]).expanduser()
-            if "build_cache_dir" in paths:
-                config.build_cache_dir = Path(paths["build_cache_dir"]).expanduser()
-            if "database_dir" in paths:
-                config.database_dir = Path(paths["database_dir"]).expanduser()
-            if "minimal_db" in paths:
-                config.minimal_db = Path(paths["minimal_db"]).expanduser()
-            if "moo_binary" in paths:
-                config.moo_binary = Path(paths["moo_binary"]).expanduser()
+            for name in Config._PATH_FIELDS:
+                if name in paths:
+                    setattr(config, name, _expand_path(paths[name]))
 
         # Build section
         if "build" in data:
@@ -289,46 +353,76 @@ def load_config() -> Config:
         if "repos" in data:
             config.repos.update(_parse_repos(data["repos"]))
 
-    # Environment overrides (highest precedence)
-    if env_repo_cache := os.environ.get("MOO_REPO_CACHE_DIR"):
-        config.repo_cache_dir = Path(env_repo_cache).expanduser()
-    if env_build_cache := os.environ.get("MOO_BUILD_CACHE_DIR"):
-        config.build_cache_dir = Path(env_build_cache).expanduser()
-    if env_db_dir := os.environ.get("MOO_DATABASE_DIR"):
-        config.database_dir = Path(env_db_dir).expanduser()
-    if env_minimal := os.environ.get("MOO_MINIMAL_DB"):
-        config.minimal_db = Path(env_minimal).expanduser()
-    if env_binary := os.environ.get("MOO_BINARY"):
-        config.moo_binary = Path(env_binary).expanduser()
-    if env_flags := os.environ.get("MOO_CONFIGURE_FLAGS"):
-        config.default_configure_flags = env_flags
-    if env_jobs := os.environ.get("MOO_MAKE_JOBS"):
-        config.make_jobs = int(env_jobs)
+    # Environment overrides (highest precedence); empty values are ignored
+    env = {k: v for k, v in os.environ.items() if k.startswith("MOO_")}
+    for name, (attr, convert) in _ENV_HANDLERS.items():
+        value = env.get(name)
+        if value:
+            setattr(config, attr, convert(value))
 
     return config
 
 
+def _mtime_ns(path: Optional[Path]) -> Optional[int]:
+    """Return path's modification time, or None if it does not exist."""
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _config_fingerprint() -> Tuple[Any, ...]:
+    """Cheap summary of every input to load_config().
+
+    Changes when either config file is edited, the project config resolves
+    to a different file, or one of the environment variables in
+    _ENV_HANDLERS changes.
+    """
+    project_path = _find_project_config()
+    return (
+        _mtime_ns(USER_CONFIG_PATH),
+        project_path,
+        _mtime_ns(project_path),
+        tuple(os.environ.get(name) for name in _ENV_HANDLERS),
+    )
+
+
 def get_config() -> Config:
     """Get the current configuration (cached).
 
+    The first call after reset_config() compares the config files and
+    environment with the ones the cached Config was loaded from, and only
+    reloads if they changed. Other calls return the cached Config.
+
     Returns:
         Config object.
     """
-    global _cached_config
+    global _cached_config, _loaded_config, _loaded_config_key
     if _cached_config is None:
-        _cached_config = load_config()
+        key = _config_fingerprint()
+        if _loaded_config is None or key != _loaded_config_key:
+            _loaded_config = load_config()
+            _loaded_config_key = key
+        _cached_config = _loaded_config
     return _cached_config
 
 
 def reset_config():
-    """Reset the cached configuration."""
-    global _cached_config
+    """Recheck the configuration and project config location on next use."""
+    global _cached_config, _cached_project_config
     _cached_config = None
+    _cached_project_config = None
 
 
-# Cached config instance
+# Config returned by get_config() until the next reset_config()
 _cached_config: Optional[Config] = None
 
+# Last loaded config and the fingerprint of its inputs, reused after a reset
+_loaded_config: Optional[Config] = None
+_loaded_config_key: Optional[Tuple[Any, ...]] = None
+
 
 def get_build_config(name: str, config: Optional[Config] = None) -> Optional[BuildConfig]:
     """Get a build configuration by name.
@@ -342,7 +436,7 @@ def get_build_config(name: str, config: Optional[Config] = None) -> Optional[Bui
     """
     if config is None:
         config = get_config()
-    return config.build_configs.get(name)
+    return config.get_build_config_map().get(name)
 
 
 def list_build_configs(config: Optional[Config] = None) -> Dict[str, BuildConfig]:
@@ -356,16 +450,10 @@ def list_build_configs(config: Optional[Config] = None) -> Dict[str, BuildConfig
     """
     if config is None:
         config = get_config()
-    return dict(config.build_configs)
+    return dict(config.get_build_config_map())
 
 
-def generate_sample_config() -> str:
-    """Generate a sample configuration file.
-
-    Returns:
-        Sample TOML configuration as a string.
-    """
-    return '''# LambdaMOO Test Suite Configuration
+_SAMPLE_CONFIG_TEMPLATE = '''# LambdaMOO Test Suite Configuration
 # Place this file at ~/.config/lambdamoo-tests/config.toml (user)
 # or .moo-tests.toml in your project directory (project)
 
@@ -409,17 +497,27 @@ default_build_config = "waterpoint"
 # default_build_config = "i64_unicode"
 
 # Predefined build configurations (these are built-in):
-#   default         - Default build with no extra options
-#   i64             - 64-bit integers
-#   i64_unicode     - 64-bit integers + Unicode strings
-#   i64_xml         - 64-bit integers + XML support
-#   i64_waifs       - 64-bit integers + Waifs with dict syntax
-#   i64_unicode_waifs - 64-bit integers + Unicode + Waifs
-#   waterpoint      - Full Waterpoint config (i64 + unicode + xml + waifs)
-#   full            - Full feature set (alias for waterpoint)
+{predefined_configs}
 
 # Add custom build configurations like this:
 # [build_configs.my_config]
 # configure_flags = ["--enable-sz=i64", "--enable-unicode", "--my-custom-flag"]
 # description = "My custom build configuration"
 '''
+
+# Built once at import; the predefined list always matches PREDEFINED_BUILD_CONFIGS
+_SAMPLE_CONFIG = _SAMPLE_CONFIG_TEMPLATE.format(
+    predefined_configs="\n".join(
+        f"#   {name:15} - {bc.description}"
+        for name, bc in PREDEFINED_BUILD_CONFIGS.items()
+    )
+)
+
+
+def generate_sample_config() -> str:
+    """Generate a sample configuration file.
+
+    Returns:
+        Sample TOML configuration as a string.
+    """
+    return _SAMPLE_CONFIG
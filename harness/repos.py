@@ -4,9 +4,14 @@ This module handles cloning, updating, and managing git repositories
 for different LambdaMOO server variants.
 """
 
+import functools
+import os
+import shutil
 import subprocess
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 
 
@@ -33,20 +38,74 @@ class RepoInfo:
     is_dirty: bool
 
 
+# Subcommands that can move HEAD; running any of them drops cached HEAD hashes
+_HEAD_MOVING_COMMANDS = frozenset({"checkout", "clone", "merge", "pull", "reset", "switch"})
+
+# Resolved HEAD commit per repository path, see get_commit_hash()
+_head_cache: Dict[str, str] = {}
+
+# Remote default branch per repository path, see get_remote_default_branch()
+_default_branch_cache: Dict[str, str] = {}
+
+
+# Per-URL locks serializing work on each cached clone, see repo_lock()
+_repo_locks: Dict[str, threading.RLock] = {}
+_repo_locks_guard = threading.Lock()
+
+
+def repo_lock(name_or_url: str) -> threading.RLock:
+    """Return the lock that guards the cached clone of a repository.
+
+    Hold it while running git commands against the shared clone from
+    multiple threads. The lock is re-entrant, so holders may call
+    get_or_clone_repo().
+
+    Args:
+        name_or_url: Repository name or URL.
+
+    Returns:
+        A re-entrant lock shared by all callers for that URL.
+    """
+    url = resolve_repo_url(name_or_url)
+    with _repo_locks_guard:
+        return _repo_locks.setdefault(url, threading.RLock())
+
+
+@functools.lru_cache(maxsize=None)
+def _git_executable() -> str:
+    """Absolute path of git, falling back to a PATH lookup at exec time."""
+    return shutil.which("git") or "git"
+
+
 def run_git(args: List[str], cwd: Optional[Path] = None, check: bool = True) -> subprocess.CompletedProcess:
     """Run a git command and return the result."""
-    cmd = ["git"] + args
+    if _head_cache and not _HEAD_MOVING_COMMANDS.isdisjoint(args):
+        _head_cache.clear()
+    cmd = [_git_executable()]
+    if cwd is not None:
+        cmd.extend(["-C", str(cwd)])
+    cmd.extend(args)
+    # Output stays bytes until a caller needs text (see _out). fds are
+    # non-inheritable by default, so the child need not close them. With
+    # an absolute executable, no cwd and close_fds=False, CPython can start
+    # git with posix_spawn instead of fork+exec.
     result = subprocess.run(
         cmd,
-        cwd=cwd,
         capture_output=True,
-        text=True,
+        close_fds=False,
     )
     if check and result.returncode != 0:
-        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr}")
+        stderr = result.stderr.decode(errors="replace")
+        raise RuntimeError(f"git {' '.join(args)} failed: {stderr}")
     return result
 
 
+def _out(result: subprocess.CompletedProcess) -> str:
+    """Decode and strip the stdout of a run_git() result."""
+    return result.stdout.decode(errors="replace").strip()
+
+
+@functools.lru_cache(maxsize=None)
 def resolve_repo_url(name_or_url: str) -> str:
     """Resolve a repo name or URL to a full URL.
 
@@ -68,6 +127,23 @@ def resolve_repo_url(name_or_url: str) -> str:
                      f"Known repos: {', '.join(KNOWN_REPOS.keys())}")
 
 
+@functools.lru_cache(maxsize=None)
+def derive_repo_dirname(url: str) -> str:
+    """Return the cache directory name for a repository URL.
+
+    Args:
+        url: Git repository URL or path.
+
+    Returns:
+        The last path component of url without a trailing ".git".
+    """
+    name = url.rstrip("/").split("/")[-1]
+    if name.endswith(".git"):
+        name = name[:-4]
+    return name
+
+
+@functools.lru_cache(maxsize=None)
 def get_default_branch(name_or_url: str) -> str:
     """Get the default branch for a repository.
 
@@ -82,13 +158,14 @@ def get_default_branch(name_or_url: str) -> str:
     return "master"  # Fallback default
 
 
-def clone_repo(url: str, dest: Path, shallow: bool = False) -> Path:
+def clone_repo(url: str, dest: Path, shallow: bool = False, depth: int = 0) -> Path:
     """Clone a repository to a destination directory.
 
     Args:
         url: Git repository URL.
         dest: Destination directory (will be created).
         shallow: If True, perform a shallow clone (--depth 1).
+        depth: History depth to clone (0 = full history). Overrides shallow.
 
     Returns:
         Path to the cloned repository.
@@ -99,9 +176,12 @@ def clone_repo(url: str, dest: Path, shallow: bool = False) -> Path:
 
     dest.parent.mkdir(parents=True, exist_ok=True)
 
+    if shallow and not depth:
+        depth = 1
+
     args = ["clone"]
-    if shallow:
-        args.extend(["--depth", "1"])
+    if depth:
+        args.extend(["--depth", str(depth)])
     args.extend([url, str(dest)])
 
     print(f"Cloning {url} to {dest}...")
@@ -110,18 +190,94 @@ def clone_repo(url: str, dest: Path, shallow: bool = False) -> Path:
     return dest
 
 
-def update_repo(repo_path: Path) -> None:
-    """Update a repository by fetching latest changes.
+def update_repo(repo_path: Path, ref: Optional[str] = None, depth: int = 0) -> bool:
+    """Update a repository by fetching a single ref from origin.
+
+    Only the requested ref (default: the remote's default branch) is
+    fetched, rather than every remote and tag.
 
     Args:
         repo_path: Path to the repository.
+        ref: Branch, tag, or full commit hash to fetch.
+        depth: History depth to fetch (0 = no limit).
+
+    Returns:
+        True if the fetch succeeded; the fetched commit is in FETCH_HEAD.
     """
     repo_path = Path(repo_path)
     if not (repo_path / ".git").exists():
         raise ValueError(f"Not a git repository: {repo_path}")
 
-    print(f"Fetching updates for {repo_path}...")
-    run_git(["fetch", "--all", "--tags"], cwd=repo_path)
+    ref = ref or get_remote_default_branch(repo_path)
+    if ref is None:
+        print(f"Fetching updates for {repo_path}...")
+        run_git(["--no-optional-locks", "fetch", "origin"], cwd=repo_path)
+        return True
+    return fetch_ref(repo_path, ref, depth)
+
+
+def fetch_ref(repo_path: Path, ref: str, depth: int = 0) -> bool:
+    """Fetch a single ref from origin into FETCH_HEAD.
+
+    Args:
+        repo_path: Path to the repository.
+        ref: Branch, tag, or full commit hash to fetch.
+        depth: History depth to fetch (0 = no limit).
+
+    Returns:
+        True if the fetch succeeded.
+    """
+    args = ["--no-optional-locks", "fetch"]
+    if depth:
+        args.extend(["--depth", str(depth)])
+    args.extend(["origin", ref])
+
+    print(f"Fetching {ref} for {repo_path}...")
+    return run_git(args, cwd=repo_path, check=False).returncode == 0
+
+
+# Touched in .git after the default branch is cloned or fetched. FETCH_HEAD
+# cannot be used: fetching any other ref rewrites it too.
+_DEFAULT_FETCH_STAMP = "lmt-default-fetch"
+
+
+def _mark_default_fetched(repo_path: Path) -> None:
+    """Record that the default branch of repo_path was just fetched."""
+    (Path(repo_path) / ".git" / _DEFAULT_FETCH_STAMP).touch()
+
+
+def _fetch_is_fresh(repo_path: Path, ttl: float) -> bool:
+    """Return True if the default branch was fetched less than ttl seconds ago."""
+    if ttl <= 0:
+        return False
+    try:
+        mtime = (Path(repo_path) / ".git" / _DEFAULT_FETCH_STAMP).stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return time.time() - mtime < ttl
+
+
+def _is_shallow(repo_path: Path) -> bool:
+    """Return True if repo_path is a shallow clone."""
+    return (Path(repo_path) / ".git" / "shallow").exists()
+
+
+def _fetch_and_checkout(repo_path: Path, ref: str, depth: int, update: bool) -> None:
+    """Checkout ref, fetching just that ref from origin when needed."""
+    if not update and run_git(["checkout", ref], cwd=repo_path, check=False).returncode == 0:
+        return
+
+    if fetch_ref(repo_path, ref, depth):
+        print(f"Checking out {ref}...")
+        run_git(["checkout", "--detach", "FETCH_HEAD"], cwd=repo_path)
+        return
+
+    # Abbreviated hashes cannot be fetched by name. A full clone already has
+    # them; a shallow one needs the rest of the history first.
+    if _is_shallow(repo_path) and run_git(["checkout", ref], cwd=repo_path, check=False).returncode != 0:
+        print(f"Fetching full history for {repo_path}...")
+        run_git(["--no-optional-locks", "fetch", "--unshallow", "origin"], cwd=repo_path)
+    checkout_ref(repo_path, ref)
 
 
 def checkout_ref(repo_path: Path, ref: str) -> None:
@@ -136,6 +292,38 @@ def checkout_ref(repo_path: Path, ref: str) -> None:
     run_git(["checkout", ref], cwd=repo_path)
 
 
+def add_worktree(repo_path: Path, dest: Path, commit: str) -> bool:
+    """Check out commit into a new detached worktree of repo_path.
+
+    The worktree shares the repository's object database, so only the
+    checked-out files are written.
+
+    Args:
+        repo_path: Path to the repository.
+        dest: Directory for the new worktree (must not exist).
+        commit: Commit to check out.
+
+    Returns:
+        True if the worktree was created.
+    """
+    result = run_git(
+        ["-C", str(repo_path), "worktree", "add", "--detach", os.path.abspath(dest), commit],
+        check=False,
+    )
+    return result.returncode == 0
+
+
+def remove_worktree(repo_path: Path, dest: Path) -> None:
+    """Remove a worktree created by add_worktree and prune its metadata.
+
+    Args:
+        repo_path: Path to the repository.
+        dest: The worktree directory.
+    """
+    run_git(["-C", str(repo_path), "worktree", "remove", "--force", os.path.abspath(dest)], check=False)
+    run_git(["-C", str(repo_path), "worktree", "prune"], check=False)
+
+
 def get_current_ref(repo_path: Path) -> str:
     """Get the current HEAD ref.
 
@@ -150,16 +338,19 @@ def get_current_ref(repo_path: Path) -> str:
     # Try to get branch name
     result = run_git(["symbolic-ref", "--short", "HEAD"], cwd=repo_path, check=False)
     if result.returncode == 0:
-        return result.stdout.strip()
+        return _out(result)
 
     # Fall back to commit hash
     result = run_git(["rev-parse", "--short", "HEAD"], cwd=repo_path)
-    return result.stdout.strip()
+    return _out(result)
 
 
 def get_commit_hash(repo_path: Path, ref: str = "HEAD") -> str:
     """Get the full commit hash for a ref.
 
+    The HEAD hash is cached per repo_path until a git command that can move
+    HEAD is run through run_git(), or get_or_clone_repo() revisits the clone.
+
     Args:
         repo_path: Path to the repository.
         ref: Git ref (default: HEAD).
@@ -167,8 +358,14 @@ def get_commit_hash(repo_path: Path, ref: str = "HEAD") -> str:
     Returns:
         Full commit hash.
     """
+    key = str(repo_path)
+    if ref == "HEAD" and key in _head_cache:
+        return _head_cache[key]
     result = run_git(["rev-parse", ref], cwd=repo_path)
-    return result.stdout.strip()
+    commit = _out(result)
+    if ref == "HEAD":
+        _head_cache[key] = commit
+    return commit
 
 
 def is_dirty(repo_path: Path) -> bool:
@@ -181,23 +378,37 @@ def is_dirty(repo_path: Path) -> bool:
         True if there are uncommitted changes.
     """
     result = run_git(["status", "--porcelain"], cwd=repo_path)
-    return len(result.stdout.strip()) > 0
+    return bool(result.stdout.strip())
 
 
 def get_remote_default_branch(repo_path: Path) -> Optional[str]:
     """Get the default branch from the remote.
 
+    The result is cached per repo_path until the next get_or_clone_repo()
+    on that clone.
+
     Args:
         repo_path: Path to the repository.
 
     Returns:
         Default branch name, or None if it cannot be determined.
     """
+    key = str(repo_path)
+    if key not in _default_branch_cache:
+        branch = _detect_remote_default_branch(repo_path)
+        if branch is None:
+            return None
+        _default_branch_cache[key] = branch
+    return _default_branch_cache[key]
+
+
+def _detect_remote_default_branch(repo_path: Path) -> Optional[str]:
+    """Ask git for the remote default branch; see get_remote_default_branch()."""
     # Try to get the default branch from origin/HEAD
     result = run_git(["symbolic-ref", "refs/remotes/origin/HEAD"], cwd=repo_path, check=False)
     if result.returncode == 0:
         # Returns something like "refs/remotes/origin/main"
-        ref = result.stdout.strip()
+        ref = _out(result)
         if ref.startswith("refs/remotes/origin/"):
             return ref[len("refs/remotes/origin/"):]
 
@@ -221,17 +432,52 @@ def list_refs(repo_path: Path) -> Dict[str, List[str]]:
     """
     repo_path = Path(repo_path)
 
-    # Get branches
-    result = run_git(["branch", "-a", "--format=%(refname:short)"], cwd=repo_path)
-    branches = [b.strip() for b in result.stdout.strip().split('\n') if b.strip()]
-
-    # Get tags
-    result = run_git(["tag", "-l"], cwd=repo_path)
-    tags = [t.strip() for t in result.stdout.strip().split('\n') if t.strip()]
+    result = run_git(
+        ["for-each-ref", "--format=%(refname)", "refs/heads", "refs/remotes", "refs/tags"],
+        cwd=repo_path,
+    )
+    branches = []
+    tags = []
+    for refname in _out(result).splitlines():
+        if refname.startswith("refs/heads/"):
+            branches.append(refname[len("refs/heads/"):])
+        elif refname.startswith("refs/remotes/"):
+            branches.append(refname[len("refs/remotes/"):])
+        elif refname.startswith("refs/tags/"):
+            tags.append(refname[len("refs/tags/"):])
 
     return {"branches": branches, "tags": tags}
 
 
+def _git_snapshot(repo_path: Path) -> Tuple[Optional[str], Optional[str], bool]:
+    """Read branch, HEAD commit and dirtiness with a single git status.
+
+    Args:
+        repo_path: Path to the repository.
+
+    Returns:
+        Tuple of (branch or None if detached, commit or None if unborn,
+        True if there are uncommitted changes).
+    """
+    result = run_git(
+        ["--no-optional-locks", "status", "--porcelain=v2", "--branch"],
+        cwd=repo_path,
+    )
+    branch = commit = None
+    dirty = False
+    for line in _out(result).splitlines():
+        if line.startswith("# branch.head "):
+            head = line[len("# branch.head "):]
+            branch = None if head == "(detached)" else head
+        elif line.startswith("# branch.oid "):
+            oid = line[len("# branch.oid "):]
+            commit = None if oid == "(initial)" else oid
+        elif line and not line.startswith("#"):
+            dirty = True
+            break
+    return branch, commit, dirty
+
+
 def get_repo_info(repo_path: Path) -> RepoInfo:
     """Get information about a repository.
 
@@ -245,22 +491,25 @@ def get_repo_info(repo_path: Path) -> RepoInfo:
 
     # Get remote URL
     result = run_git(["remote", "get-url", "origin"], cwd=repo_path, check=False)
-    url = result.stdout.strip() if result.returncode == 0 else "unknown"
+    url = _out(result) if result.returncode == 0 else "unknown"
 
     # Derive name from URL or path
-    if url != "unknown":
-        name = url.rstrip("/").split("/")[-1]
-        if name.endswith(".git"):
-            name = name[:-4]
+    name = derive_repo_dirname(url) if url != "unknown" else repo_path.name
+
+    branch, commit, dirty = _git_snapshot(repo_path)
+    if branch:
+        current_ref = branch
+    elif commit:
+        current_ref = _out(run_git(["rev-parse", "--short", commit], cwd=repo_path))
     else:
-        name = repo_path.name
+        current_ref = get_current_ref(repo_path)
 
     return RepoInfo(
         name=name,
         url=url,
         path=repo_path,
-        current_ref=get_current_ref(repo_path),
-        is_dirty=is_dirty(repo_path),
+        current_ref=current_ref,
+        is_dirty=dirty,
     )
 
 
@@ -269,6 +518,8 @@ def get_or_clone_repo(
     cache_dir: Path,
     ref: Optional[str] = None,
     update: bool = True,
+    depth: int = 0,
+    fetch_ttl: float = 0,
 ) -> Path:
     """Get a repository, cloning if necessary.
 
@@ -277,49 +528,102 @@ def get_or_clone_repo(
     2. Optionally fetch updates
     3. Checkout the specified ref (if provided)
 
+    Updates fetch only the requested ref (or the default branch tip). With
+    depth > 0 a new clone is shallow and its fetches use that depth; an
+    existing full clone keeps fetching full history.
+
     Args:
         name_or_url: Repository name or URL.
         cache_dir: Directory to cache cloned repositories.
         ref: Git ref to checkout. If None, stays on current/default branch.
         update: If True, fetch updates before checkout.
+        depth: History depth for clones and fetches (0 = full history).
+        fetch_ttl: With no ref, skip the update if the repo was fetched
+            within this many seconds (0 = always fetch).
 
     Returns:
         Path to the repository.
     """
+    with repo_lock(name_or_url):
+        return _get_or_clone_repo(name_or_url, cache_dir, ref, update, depth, fetch_ttl)
+
+
+def _get_or_clone_repo(
+    name_or_url: str,
+    cache_dir: Path,
+    ref: Optional[str],
+    update: bool,
+    depth: int,
+    fetch_ttl: float,
+) -> Path:
+    """get_or_clone_repo() body; the caller holds repo_lock(name_or_url)."""
     url = resolve_repo_url(name_or_url)
 
-    # Determine repo directory name
-    repo_name = url.rstrip("/").split("/")[-1]
-    if repo_name.endswith(".git"):
-        repo_name = repo_name[:-4]
+    repo_path = Path(cache_dir) / derive_repo_dirname(url)
 
-    repo_path = Path(cache_dir) / repo_name
+    # Other processes share the clone and may have fetched or moved HEAD
+    # since this process last looked, so start from a clean slate
+    key = str(repo_path)
+    _head_cache.pop(key, None)
+    _default_branch_cache.pop(key, None)
 
     # Clone if needed (git clone automatically checks out the default branch)
     freshly_cloned = False
     if not repo_path.exists():
-        clone_repo(url, repo_path)
+        clone_repo(url, repo_path, depth=depth)
+        _mark_default_fetched(repo_path)
         freshly_cloned = True
-    elif update:
-        update_repo(repo_path)
+    elif depth and not _is_shallow(repo_path):
+        # Shallow fetches would truncate an existing full clone's history
+        depth = 0
 
-    # Checkout ref if explicitly specified
+    # Checkout ref if explicitly specified. A fresh full clone already has
+    # every ref, so only shallow clones need to fetch it.
     if ref:
-        checkout_ref(repo_path, ref)
+        fetch = update and (depth or not freshly_cloned)
+        _fetch_and_checkout(repo_path, ref, depth, fetch)
     elif not freshly_cloned and update:
-        # For existing repos being updated, ensure we're on the default branch
-        # and have the latest changes
+        # For existing repos being updated, move to the latest default branch.
+        # After a recent fetch the remote-tracking branch is current enough.
         default_branch = get_remote_default_branch(repo_path)
-        if default_branch:
-            current = get_current_ref(repo_path)
-            if current != default_branch:
-                checkout_ref(repo_path, default_branch)
-            # Pull latest changes on the default branch
-            run_git(["pull", "--ff-only"], cwd=repo_path, check=False)
+        if _fetch_is_fresh(repo_path, fetch_ttl):
+            target = f"origin/{default_branch}"
+        elif update_repo(repo_path, default_branch, depth):
+            _mark_default_fetched(repo_path)
+            target = "FETCH_HEAD"
+        else:
+            target = None
+        if default_branch and target:
+            _fast_forward(repo_path, default_branch, target)
 
     return repo_path
 
 
+def _fast_forward(repo_path: Path, branch: str, target: str) -> None:
+    """Move repo_path onto branch and fast-forward it to target.
+
+    A shallow fetch has no history linking target to the local branch, so
+    in a shallow clone the branch is reset to target instead, provided no
+    tracked file is modified. Failures (a dirty tree, local commits that
+    diverge from target) are reported and the current HEAD is kept.
+    """
+    if get_current_ref(repo_path) != branch:
+        print(f"Checking out {branch}...")
+        result = run_git(["checkout", branch], cwd=repo_path, check=False)
+        if result.returncode != 0:
+            print(f"Warning: could not check out {branch}; building the current HEAD")
+            return
+    if _is_shallow(repo_path):
+        if run_git(["diff-index", "--quiet", "HEAD", "--"], cwd=repo_path, check=False).returncode != 0:
+            print(f"Warning: {repo_path} has local changes; building the current HEAD")
+            return
+        result = run_git(["reset", "--keep", target], cwd=repo_path, check=False)
+    else:
+        result = run_git(["merge", "--ff-only", target], cwd=repo_path, check=False)
+    if result.returncode != 0:
+        print(f"Warning: could not fast-forward {branch} to {target}; building the current HEAD")
+
+
 def list_known_repos() -> Dict[str, str]:
     """List known repository names and URLs.
 
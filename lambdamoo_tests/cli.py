@@ -11,18 +11,13 @@ Usage:
 """
 
 import argparse
+import functools
+import os
 import sys
 from pathlib import Path
 
 
-def add_build_parser(subparsers):
-    """Add the 'build' subcommand parser."""
-    parser = subparsers.add_parser(
-        'build',
-        help='Build MOO server from source or repository',
-        description='Build MOO server binary from source or repository',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_BUILD_EPILOG = """
 Examples:
   lmt build --repo lambdamoo --config waterpoint
   lmt build --repo lambdamoo --ref v1.8.1 --config i64_unicode
@@ -30,6 +25,16 @@ Examples:
   lmt build --list-repos
   lmt build --list-configs
 """
+
+
+def add_build_parser(subparsers):
+    """Add the 'build' subcommand parser."""
+    parser = subparsers.add_parser(
+        'build',
+        help='Build MOO server from source or repository',
+        description='Build MOO server binary from source or repository',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_BUILD_EPILOG,
     )
 
     source_group = parser.add_mutually_exclusive_group()
@@ -55,7 +60,8 @@ Examples:
     parser.add_argument(
         "--config", "-c",
         dest="build_config",
-        help="Named build configuration (e.g., waterpoint, i64_unicode)"
+        help="Named build configuration (e.g., waterpoint, i64_unicode); "
+             "a comma-separated list builds each in parallel"
     )
     parser.add_argument(
         "--configure-flags",
@@ -81,14 +87,7 @@ Examples:
     return parser
 
 
-def add_setup_parser(subparsers):
-    """Add the 'setup' subcommand parser."""
-    parser = subparsers.add_parser(
-        'setup',
-        help='Set up test databases',
-        description='Set up test databases for LambdaMOO test suite',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_SETUP_EPILOG = """
 Examples:
   lmt setup
   lmt setup --moo-binary ./builds/moo --minimal-db ./Minimal.db
@@ -96,6 +95,16 @@ Examples:
   lmt setup --only test
   lmt setup --check-only
 """
+
+
+def add_setup_parser(subparsers):
+    """Add the 'setup' subcommand parser."""
+    parser = subparsers.add_parser(
+        'setup',
+        help='Set up test databases',
+        description='Set up test databases for LambdaMOO test suite',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_SETUP_EPILOG,
     )
 
     parser.add_argument(
@@ -123,6 +132,11 @@ Examples:
         action="store_true",
         help="Only check prerequisites without creating databases"
     )
+    parser.add_argument(
+        "--deep-check",
+        action="store_true",
+        help="Also run the MOO binary when checking prerequisites"
+    )
     parser.add_argument(
         "--build-if-missing",
         action="store_true",
@@ -141,14 +155,7 @@ Examples:
     return parser
 
 
-def add_clean_parser(subparsers):
-    """Add the 'clean' subcommand parser."""
-    parser = subparsers.add_parser(
-        'clean',
-        help='Clean cached repositories and builds',
-        description='Clean LambdaMOO test suite caches',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_CLEAN_EPILOG = """
 Examples:
   lmt clean --list
   lmt clean --all
@@ -157,6 +164,16 @@ Examples:
   lmt clean --all --dry-run
   lmt clean --all --force
 """
+
+
+def add_clean_parser(subparsers):
+    """Add the 'clean' subcommand parser."""
+    parser = subparsers.add_parser(
+        'clean',
+        help='Clean cached repositories and builds',
+        description='Clean LambdaMOO test suite caches',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_CLEAN_EPILOG,
     )
 
     parser.add_argument(
@@ -193,14 +210,7 @@ Examples:
     return parser
 
 
-def add_roundtrip_parser(subparsers):
-    """Add the 'roundtrip' subcommand parser."""
-    parser = subparsers.add_parser(
-        'roundtrip',
-        help='Load a database, checkpoint, and verify output',
-        description='Test database round-trip (load -> checkpoint -> compare)',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_ROUNDTRIP_EPILOG = """
 Examples:
   # Basic round trip with a built binary
   lmt roundtrip --database /path/to/production.db --build lambdamoo
@@ -217,6 +227,16 @@ Examples:
   # Specify output location
   lmt roundtrip --database /path/to/production.db --build lambdamoo --output ./output.db
 """
+
+
+def add_roundtrip_parser(subparsers):
+    """Add the 'roundtrip' subcommand parser."""
+    parser = subparsers.add_parser(
+        'roundtrip',
+        help='Load a database, checkpoint, and verify output',
+        description='Test database round-trip (load -> checkpoint -> compare)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_ROUNDTRIP_EPILOG,
     )
 
     parser.add_argument(
@@ -275,14 +295,7 @@ Examples:
     return parser
 
 
-def add_test_parser(subparsers):
-    """Add the 'test' subcommand parser."""
-    parser = subparsers.add_parser(
-        'test',
-        help='Run the test suite',
-        description='Run LambdaMOO test suite',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_TEST_EPILOG = """
 Examples:
   # Run with explicit binary
   lmt test --candidate ./moo
@@ -309,6 +322,16 @@ Build spec format:
   [name=]repo:ref:config      With specific git ref
   Note: --prior-build requires name=, --build derives name if omitted
 """
+
+
+def add_test_parser(subparsers):
+    """Add the 'test' subcommand parser."""
+    parser = subparsers.add_parser(
+        'test',
+        help='Run the test suite',
+        description='Run LambdaMOO test suite',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_TEST_EPILOG,
     )
 
     # Candidate specification (mutually exclusive)
@@ -363,33 +386,51 @@ Build spec format:
     return parser
 
 
-def cmd_build(args):
-    """Execute the build command."""
-    from harness.build import build_server, list_known_repos
+@functools.lru_cache(maxsize=1)
+def _formatted_repo_listing() -> str:
+    """Return the ``--list-repos`` output as a single string."""
+    from harness.build import list_known_repos
+
+    lines = ["Known repositories:"]
+    lines.extend(f"  {name:15} {url}" for name, url in list_known_repos().items())
+    return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=1)
+def _formatted_config_listing() -> str:
+    """Return the ``--list-configs`` output as a single string."""
     from harness.config import list_build_configs
 
+    lines = ["Available build configurations:"]
+    for name, bc in sorted(list_build_configs().items()):
+        flags = " ".join(bc.configure_flags) if bc.configure_flags else "(default)"
+        lines.append(f"  {name:20} {bc.description}")
+        lines.append(f"                       Flags: {flags}")
+    return "\n".join(lines)
+
+
+def cmd_build(args):
+    """Execute the build command."""
     # Handle --list-repos
     if args.list_repos:
-        print("Known repositories:")
-        for name, url in list_known_repos().items():
-            print(f"  {name:15} {url}")
+        print(_formatted_repo_listing())
         return 0
 
     # Handle --list-configs
     if args.list_configs:
-        print("Available build configurations:")
-        configs = list_build_configs()
-        for name, bc in sorted(configs.items()):
-            flags = " ".join(bc.configure_flags) if bc.configure_flags else "(default)"
-            print(f"  {name:20} {bc.description}")
-            print(f"                       Flags: {flags}")
+        print(_formatted_config_listing())
         return 0
 
+    from harness.build import build_server
+
     # Require source or repo
     if not args.source and not args.repo:
         print("Error: Must specify --source or --repo", file=sys.stderr)
         return 1
 
+    if args.build_config and "," in args.build_config:
+        return _build_multiple_configs(args)
+
     try:
         binary = build_server(
             source_dir=args.source,
@@ -407,14 +448,47 @@ def cmd_build(args):
         return 1
 
 
+def _build_multiple_configs(args):
+    """Build a comma-separated list of --config values in parallel."""
+    from harness.build import BuildSpec, build_many
+
+    if not args.repo:
+        print("Error: Multiple --config values require --repo", file=sys.stderr)
+        return 1
+    if args.configure_flags:
+        print("Error: --configure-flags cannot be combined with multiple --config values",
+              file=sys.stderr)
+        return 1
+
+    names = [name.strip() for name in args.build_config.split(",") if name.strip()]
+    specs = [
+        BuildSpec(
+            repo=args.repo,
+            ref=args.ref,
+            build_config=name,
+            output_dir=args.output / name if args.output else None,
+        )
+        for name in names
+    ]
+    try:
+        binaries = build_many(specs, use_cache=not args.no_cache)
+    except Exception as e:
+        print(f"\nError: {e}", file=sys.stderr)
+        return 1
+
+    print()
+    for name, binary in zip(names, binaries):
+        print(f"Success: {name}: {binary}")
+    return 0
+
+
 def cmd_setup(args):
     """Execute the setup command."""
     from lambdamoo_tests.setup import (
         find_moo_binary,
         find_minimal_db,
         check_prerequisites,
-        setup_test_database,
-        setup_multiplayer_database,
+        setup_databases,
     )
     from harness.config import get_config
 
@@ -475,7 +549,7 @@ def cmd_setup(args):
 
     # Check prerequisites
     print("Checking prerequisites...")
-    if not check_prerequisites(moo_binary, minimal_db):
+    if not check_prerequisites(moo_binary, minimal_db, deep_check=args.deep_check):
         print("\nPrerequisites check failed", file=sys.stderr)
         return 1
 
@@ -490,15 +564,7 @@ def cmd_setup(args):
 
     # Set up databases
     print("\nSetting up test databases...")
-    success = True
-
-    if not args.only or args.only == "test":
-        if not setup_test_database(moo_binary, minimal_db, output_dir):
-            success = False
-
-    if not args.only or args.only == "multiplayer":
-        if not setup_multiplayer_database(moo_binary, minimal_db, output_dir):
-            success = False
+    success = setup_databases(moo_binary, minimal_db, output_dir, only=args.only)
 
     if success:
         print("\nSetup complete!")
@@ -515,7 +581,8 @@ def cmd_clean(args):
     """Execute the clean command."""
     from harness.clean import (
         list_cache_contents,
-        get_cache_info_totals,
+        get_cache_info,
+        get_state_info,
         clean_directory,
         format_size,
     )
@@ -536,17 +603,16 @@ def cmd_clean(args):
     clean_repos = args.all or args.repos
     clean_builds = args.all or args.builds
 
-    # Calculate what would be cleaned
-    repos_items, repos_bytes = 0, 0
-    builds_items, builds_bytes = 0, 0
-
-    if clean_repos:
-        repos_items, repos_bytes = get_cache_info_totals(config.repo_cache_dir)
-    if clean_builds:
-        builds_items, builds_bytes = get_cache_info_totals(config.build_cache_dir)
+    # Calculate what would be cleaned; the listings are reused for deletion
+    repos_info = get_cache_info(config.repo_cache_dir) if clean_repos else []
+    builds_info = get_cache_info(config.build_cache_dir) if clean_builds else []
+    state_info = get_state_info(config) if clean_builds else []
+    repos_items, repos_bytes = len(repos_info), sum(size for _, size in repos_info)
+    builds_items, builds_bytes = len(builds_info), sum(size for _, size in builds_info)
+    state_bytes = sum(size for _, size in state_info)
 
-    total_items = repos_items + builds_items
-    total_bytes = repos_bytes + builds_bytes
+    total_items = repos_items + builds_items + len(state_info)
+    total_bytes = repos_bytes + builds_bytes + state_bytes
 
     if total_items == 0:
         print("Nothing to clean.")
@@ -558,6 +624,8 @@ def cmd_clean(args):
         print(f"  Repository cache: {repos_items} items, {format_size(repos_bytes)}")
     if clean_builds and builds_items > 0:
         print(f"  Build cache:      {builds_items} items, {format_size(builds_bytes)}")
+    if state_info:
+        print(f"  Harness state:    {format_size(state_bytes)}")
     print(f"  Total:            {total_items} items, {format_size(total_bytes)}")
 
     if args.dry_run:
@@ -577,14 +645,17 @@ def cmd_clean(args):
 
     # Actually clean
     if clean_repos:
-        items, bytes_freed = clean_directory(config.repo_cache_dir)
+        items, bytes_freed = clean_directory(config.repo_cache_dir, items=repos_info)
         if items > 0:
             print(f"Cleaned repository cache: {items} items, {format_size(bytes_freed)}")
 
     if clean_builds:
-        items, bytes_freed = clean_directory(config.build_cache_dir)
+        items, bytes_freed = clean_directory(config.build_cache_dir, items=builds_info)
         if items > 0:
             print(f"Cleaned build cache: {items} items, {format_size(bytes_freed)}")
+        if state_info:
+            clean_directory(config.build_state_dir, items=state_info)
+            print(f"Cleaned harness state: {format_size(state_bytes)}")
 
     print("Done.")
     return 0
@@ -605,21 +676,21 @@ def parse_build_spec(spec: str):
         Tuple of (name, repo, ref, config) where name, ref, and config may be None.
     """
     # Check for name= prefix
-    name = None
-    if '=' in spec:
-        name, spec = spec.split('=', 1)
-        if not name:
-            raise ValueError(f"Invalid build spec: name cannot be empty")
-
-    parts = spec.split(':')
-    if len(parts) == 1:
-        return (name, parts[0], None, None)
-    elif len(parts) == 2:
-        return (name, parts[0], None, parts[1])
-    elif len(parts) == 3:
-        return (name, parts[0], parts[1], parts[2])
-    else:
-        raise ValueError(f"Invalid build spec: {spec}. Use 'repo', 'repo:config', or 'repo:ref:config'")
+    name, eq, body = spec.partition('=')
+    if not eq:
+        name, body = None, spec
+    elif not name:
+        raise ValueError(f"Invalid build spec: name cannot be empty")
+
+    repo, sep, tail = body.partition(':')
+    if not sep:
+        return (name, repo, None, None)
+    ref, sep, config = tail.partition(':')
+    if not sep:
+        return (name, repo, None, ref)
+    if ':' in config:
+        raise ValueError(f"Invalid build spec: {body}. Use 'repo', 'repo:config', or 'repo:ref:config'")
+    return (name, repo, ref, config)
 
 
 def parse_prior_build_spec(spec: str):
@@ -685,7 +756,8 @@ def features_from_configure_flags(flags: list) -> list:
     return features
 
 
-def resolve_or_build(repo: str, ref: str, config: str, name: str = None) -> tuple:
+def resolve_or_build(repo: str, ref: str, config: str, name: str = None,
+                     stream: bool = True) -> tuple:
     """Resolve a binary from cache or build it.
 
     Args:
@@ -693,6 +765,7 @@ def resolve_or_build(repo: str, ref: str, config: str, name: str = None) -> tupl
         ref: Git ref (branch, tag, commit) or None for default.
         config: Build configuration name, or None to use repo's build script.
         name: Server name, or None to derive from spec.
+        stream: If True, echo build output as it is produced.
 
     Returns:
         Tuple of (name, Path to binary, list of known features or None).
@@ -711,7 +784,7 @@ def resolve_or_build(repo: str, ref: str, config: str, name: str = None) -> tupl
     if config:
         build_config_obj = get_build_config(config, cfg)
         if build_config_obj is None:
-            available = ", ".join(cfg.build_configs.keys())
+            available = ", ".join(cfg.get_build_config_map())
             raise ValueError(f"Unknown build config: {config}. Available: {available}")
 
     # Get known features - first from repo config, then augment with build config
@@ -740,6 +813,7 @@ def resolve_or_build(repo: str, ref: str, config: str, name: str = None) -> tupl
         build_config=config,
         use_cache=True,
         config=cfg,
+        stream=stream,
     )
 
     print(f"  -> {binary}")
@@ -889,7 +963,61 @@ def cmd_roundtrip(args):
 
 def cmd_test(args):
     """Execute the test command."""
-    import subprocess
+    # Validate explicit arguments before anything is imported or built
+    if args.candidate and not args.candidate.exists():
+        print(f"Error: Candidate binary not found: {args.candidate}", file=sys.stderr)
+        return 1
+
+    for prior in args.prior:
+        if ':' not in prior:
+            print(f"Error: Invalid --prior format: {prior}. Use 'name:path'", file=sys.stderr)
+            return 1
+
+    # Parse every build spec before resolving any of them
+    candidate_spec = None
+    if args.build_spec and not args.candidate:
+        try:
+            candidate_spec = parse_build_spec(args.build_spec)
+        except ValueError as e:
+            print(f"Error building candidate: {e}", file=sys.stderr)
+            return 1
+
+    prior_specs = []
+    for prior_spec in args.prior_build:
+        try:
+            prior_specs.append(parse_prior_build_spec(prior_spec))
+        except ValueError as e:
+            print(f"Error building prior: {e}", file=sys.stderr)
+            return 1
+
+    # Resolve the candidate and built priors concurrently; results are
+    # collected in submission order so --prior arguments keep their order.
+    # Concurrent build output would interleave, so it is only streamed for
+    # a single spec.
+    specs = ([candidate_spec] if candidate_spec else []) + prior_specs
+    resolved = []
+    if specs:
+        from concurrent.futures import ThreadPoolExecutor
+
+        stream = len(specs) == 1
+        pool = ThreadPoolExecutor(max_workers=min(8, len(specs)))
+        futures = [
+            pool.submit(resolve_or_build, repo, ref, config, name, stream)
+            for name, repo, ref, config in specs
+        ]
+        try:
+            for i, future in enumerate(futures):
+                try:
+                    resolved.append(future.result())
+                except Exception as e:
+                    kind = "candidate" if candidate_spec and i == 0 else "prior"
+                    print(f"Error building {kind}: {e}", file=sys.stderr)
+                    # Don't start builds that are still queued
+                    for pending in futures:
+                        pending.cancel()
+                    return 1
+        finally:
+            pool.shutdown(wait=False)
 
     # Resolve candidate binary and name
     candidate_name = None
@@ -899,36 +1027,17 @@ def cmd_test(args):
     if args.candidate:
         candidate_binary = args.candidate
         candidate_name = "candidate"  # Default name for explicit binary
-        if not candidate_binary.exists():
-            print(f"Error: Candidate binary not found: {candidate_binary}", file=sys.stderr)
-            return 1
-    elif args.build_spec:
-        try:
-            name, repo, ref, config = parse_build_spec(args.build_spec)
-            candidate_name, candidate_binary, candidate_features = resolve_or_build(repo, ref, config, name)
-        except Exception as e:
-            print(f"Error building candidate: {e}", file=sys.stderr)
-            return 1
+    elif candidate_spec:
+        candidate_name, candidate_binary, candidate_features = resolved.pop(0)
 
     # Resolve prior binaries
     prior_args = []
 
     # Explicit prior binaries
-    for prior in args.prior:
-        if ':' not in prior:
-            print(f"Error: Invalid --prior format: {prior}. Use 'name:path'", file=sys.stderr)
-            return 1
-        prior_args.append(prior)
+    prior_args.extend(args.prior)
 
     # Built prior binaries
-    for prior_spec in args.prior_build:
-        try:
-            name, repo, ref, config = parse_prior_build_spec(prior_spec)
-            prior_name, binary, _ = resolve_or_build(repo, ref, config, name)
-            prior_args.append(f"{prior_name}:{binary}")
-        except Exception as e:
-            print(f"Error building prior: {e}", file=sys.stderr)
-            return 1
+    prior_args.extend(f"{prior_name}:{binary}" for prior_name, binary, _ in resolved)
 
     # Build pytest command
     pytest_cmd = [sys.executable, "-m", "pytest"]
@@ -957,23 +1066,75 @@ def cmd_test(args):
         pytest_cmd.extend(args.pytest_args)
 
     # Run pytest
-    print(f"\nRunning: {' '.join(str(x) for x in pytest_cmd)}\n")
+    import shlex
+
+    print(f"\nRunning: {shlex.join(map(os.fspath, pytest_cmd))}\n")
+
+    # Replace this process with pytest unless a wrapper needs to stay around
+    if os.name == "posix" and not os.environ.get("LMT_NO_EXEC"):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execvp(sys.executable, pytest_cmd)
+
+    import subprocess
+
     result = subprocess.run(pytest_cmd)
     return result.returncode
 
 
-def main():
-    """Main entry point for the lmt command."""
-    parser = argparse.ArgumentParser(
-        prog='lmt',
-        description='LambdaMOO Test Suite - Build, test, and validate MOO servers',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_SUBCOMMANDS = {
+    'build': add_build_parser,
+    'setup': add_setup_parser,
+    'clean': add_clean_parser,
+    'test': add_test_parser,
+    'roundtrip': add_roundtrip_parser,
+}
+
+_HANDLERS = {
+    'build': cmd_build,
+    'setup': cmd_setup,
+    'clean': cmd_clean,
+    'test': cmd_test,
+    'roundtrip': cmd_roundtrip,
+}
+
+_GLOBAL_VALUE_FLAGS = ('-C', '--cache-dir')
+
+
+def _sniff_subcommand(argv):
+    """Find the subcommand in argv without building the full parser.
+
+    Global flags and their values are skipped. Returns None when top-level
+    help is requested or the first positional token is not a known
+    subcommand, so the caller can fall back to registering every subparser.
+
+    Args:
+        argv: Command line arguments, excluding the program name.
+
+    Returns:
+        Subcommand name, or None.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in _GLOBAL_VALUE_FLAGS:
+            next(args, None)
+        elif arg.startswith('-'):
+            if arg in ('-h', '--help'):
+                return None
+        else:
+            return arg if arg in _SUBCOMMANDS else None
+    return None
+
+
+_TOP_LEVEL_DESCRIPTION = 'LambdaMOO Test Suite - Build, test, and validate MOO servers'
+
+_TOP_LEVEL_EPILOG = """
 Commands:
-  build    Build MOO server from source or repository
-  setup    Set up test databases
-  clean    Clean cached repositories and builds
-  test     Run the test suite
+  build      Build MOO server from source or repository
+  setup      Set up test databases
+  clean      Clean cached repositories and builds
+  test       Run the test suite
+  roundtrip  Load a database, checkpoint, and verify output
 
 Examples:
   # Build a server with waterpoint config
@@ -998,12 +1159,37 @@ Environment Variables:
   MOO_BUILD_CACHE_DIR   Build cache directory
   MOO_REPO_CACHE_DIR    Repository cache directory
 """
+
+# Printed for a bare `lmt`, which needs no parser at all
+_STATIC_TOP_HELP = (
+    "usage: lmt [-h] [--version] [--cache-dir DIR] <command> ...\n\n"
+    + _TOP_LEVEL_DESCRIPTION + "\n" + _TOP_LEVEL_EPILOG
+)
+
+
+def main():
+    """Main entry point for the lmt command."""
+    from lambdamoo_tests import __version__
+
+    argv = sys.argv[1:]
+    if not argv:
+        print(_STATIC_TOP_HELP)
+        return 0
+    if argv in (['-V'], ['--version']):
+        print(f"lmt {__version__}")
+        return 0
+
+    parser = argparse.ArgumentParser(
+        prog='lmt',
+        description=_TOP_LEVEL_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_TOP_LEVEL_EPILOG,
     )
 
     parser.add_argument(
         '--version', '-V',
         action='version',
-        version='%(prog)s 0.1.0'
+        version=f'%(prog)s {__version__}'
     )
     parser.add_argument(
         '--cache-dir', '-C',
@@ -1014,12 +1200,14 @@ Environment Variables:
 
     subparsers = parser.add_subparsers(dest='command', metavar='<command>')
 
-    # Add subcommand parsers
-    add_build_parser(subparsers)
-    add_setup_parser(subparsers)
-    add_clean_parser(subparsers)
-    add_test_parser(subparsers)
-    add_roundtrip_parser(subparsers)
+    # Only the invoked subcommand's parser is needed; help and error
+    # paths get all of them so the listed choices stay complete.
+    command = _sniff_subcommand(argv)
+    if command:
+        _SUBCOMMANDS[command](subparsers)
+    else:
+        for add_parser in _SUBCOMMANDS.values():
+            add_parser(subparsers)
 
     # Parse arguments
     args = parser.parse_args()
@@ -1031,22 +1219,13 @@ Environment Variables:
     # Apply global --cache-dir option to config
     if args.cache_dir:
         from harness.config import get_config, reset_config
-        import os
         cache_dir = args.cache_dir.resolve()
         os.environ['MOO_BUILD_CACHE_DIR'] = str(cache_dir / 'builds')
         os.environ['MOO_REPO_CACHE_DIR'] = str(cache_dir / 'repos')
         reset_config()  # Force config reload with new env vars
 
     # Dispatch to command handler
-    handlers = {
-        'build': cmd_build,
-        'setup': cmd_setup,
-        'clean': cmd_clean,
-        'test': cmd_test,
-        'roundtrip': cmd_roundtrip,
-    }
-
-    handler = handlers.get(args.command)
+    handler = _HANDLERS.get(args.command)
     if handler:
         return handler(args)
     else:
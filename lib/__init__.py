@@ -7,22 +7,34 @@ This module provides:
 - Assertions: Test assertion helpers
 """
 
-from .moo_server import MooServer, MooServerInstance, MooClient
-from .client import MooClient as StandaloneMooClient
-from .assertions import (
-    assert_moo_value,
-    assert_moo_error,
-    assert_moo_list,
-    assert_moo_success,
-)
-
-__all__ = [
-    'MooServer',
-    'MooServerInstance',
-    'MooClient',
-    'StandaloneMooClient',
-    'assert_moo_value',
-    'assert_moo_error',
-    'assert_moo_list',
-    'assert_moo_success',
-]
+import importlib
+
+# Public name -> (submodule, attribute). Submodules are imported on first
+# access so that e.g. `from lib.assertions import ...` does not pay for the
+# server and socket modules.
+_LAZY_EXPORTS = {
+    'MooServer': ('moo_server', 'MooServer'),
+    'MooServerInstance': ('moo_server', 'MooServerInstance'),
+    'MooClient': ('moo_server', 'MooClient'),
+    'StandaloneMooClient': ('client', 'MooClient'),
+    'assert_moo_value': ('assertions', 'assert_moo_value'),
+    'assert_moo_error': ('assertions', 'assert_moo_error'),
+    'assert_moo_list': ('assertions', 'assert_moo_list'),
+    'assert_moo_success': ('assertions', 'assert_moo_success'),
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,5 @@
 """Custom assertions for MOO testing."""
 
-import re
 from typing import Any, List, Set, Optional
 
 
@@ -68,6 +67,9 @@ def assert_moo_value(actual: str, expected: str, message: str = ""):
     Raises:
         AssertionError: If values don't match.
     """
+    if actual == expected:
+        return
+
     # Normalize whitespace
     actual_normalized = ' '.join(actual.split())
     expected_normalized = ' '.join(expected.split())
@@ -161,7 +163,10 @@ def assert_moo_list(result: tuple, expected_elements: List[Any], message: str =
         raise AssertionError(f"Expected list but got: {value}")
 
     # Build expected list string
-    expected_str = '{' + ', '.join(str(e) for e in expected_elements) + '}'
+    expected_str = '{' + ', '.join(map(str, expected_elements)) + '}'
+
+    if value == expected_str:
+        return
 
     # Normalize and compare
     actual_normalized = ' '.join(value.split())
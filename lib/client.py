@@ -1,22 +1,18 @@
 """MOO network client for testing."""
 
-import re
+import select
+import selectors
 import socket
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, List
 
+from .protocol import parse_eval_response, scan_eval_response
+
 
 class MooClient:
     """Network client for interacting with MOO servers."""
 
-    # Patterns to match MOO evaluation results from do_command verb:
-    # Success: "#-1:  => value" (caller object followed by result)
-    EVAL_SUCCESS_PATTERN = re.compile(r'^[#\-\d]+:\s*=>\s*(.+)$', re.MULTILINE)
-    # Error from eval(): "** error_info" (always indicates failure)
-    EVAL_ERROR_PATTERN = re.compile(r'^\*\*\s+(.+)$', re.MULTILINE)
-    # Traceback: multi-line error with "(End of traceback)"
-    EVAL_TRACEBACK_PATTERN = re.compile(r'^#[^:]+:.*line\s+\d+:', re.MULTILINE)
-
     def __init__(self,
                  host: str = 'localhost',
                  port: int = 7777,
@@ -33,8 +29,11 @@ class MooClient:
         self.port = port
         self.timeout = timeout
         self._socket: Optional[socket.socket] = None
-        self._buffer = ""
+        self._buffer = bytearray()  # Received bytes not yet returned
         self._connected = False
+        # Progress of the pending eval's response through _buffer
+        self._eval_scanned = 0
+        self._eval_complete = False
 
         self.connect()
 
@@ -43,10 +42,13 @@ class MooClient:
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._socket.settimeout(self.timeout)
         self._socket.connect((self.host, self.port))
+        # Commands are small writes; send them without waiting on Nagle
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._buffer.clear()
         self._connected = True
 
         # Read initial connection output (welcome message, etc.)
-        time.sleep(0.1)
+        self._wait_for_output(0.1)
         self._read_available()
 
     def close(self):
@@ -59,41 +61,58 @@ class MooClient:
             self._socket = None
         self._connected = False
 
+    def _wait_for_output(self, timeout: float) -> bool:
+        """Wait until the server has sent data, or timeout seconds pass."""
+        if self._buffer:
+            return True
+        readable, _, _ = select.select([self._socket], [], [], timeout)
+        return bool(readable)
+
     def _read_line(self, timeout: Optional[float] = None) -> str:
-        """Read a single line from the socket (up to and including newline)."""
-        timeout = timeout or self.timeout
-        self._socket.settimeout(timeout)
-        data = []
-        try:
-            while True:
-                chunk = self._socket.recv(1)
-                if not chunk:
-                    break
-                char = chunk.decode('utf-8', errors='replace')
-                data.append(char)
-                if char == '\n':
-                    break
-        except socket.timeout:
-            pass
-        finally:
-            self._socket.settimeout(self.timeout)
-        return ''.join(data)
+        """Read a single line from the socket (up to and including newline).
+
+        Data is received in chunks; anything after the newline stays in the
+        buffer for the next read.
+        """
+        buf = self._buffer
+        idx = buf.find(b'\n')
+        if idx < 0:
+            self._socket.settimeout(timeout or self.timeout)
+            try:
+                while idx < 0:
+                    chunk = self._socket.recv(4096)
+                    if not chunk:
+                        break
+                    start = len(buf)
+                    buf += chunk
+                    idx = buf.find(b'\n', start)
+            except socket.timeout:
+                pass
+            finally:
+                self._socket.settimeout(self.timeout)
+        end = idx + 1 if idx >= 0 else len(buf)
+        line = buf[:end].decode('utf-8', errors='replace')
+        del buf[:end]
+        return line
 
     def _read_available(self, timeout: float = 0.05) -> str:
         """Read any immediately available data without blocking long."""
         self._socket.settimeout(timeout)
-        data = []
+        buf = self._buffer
         try:
             while True:
                 chunk = self._socket.recv(4096)
                 if not chunk:
                     break
-                data.append(chunk.decode('utf-8', errors='replace'))
+                buf += chunk
         except socket.timeout:
             pass
         finally:
             self._socket.settimeout(self.timeout)
-        return ''.join(data)
+        # Decode once so multi-byte characters split across recv() calls survive
+        result = buf.decode('utf-8', errors='replace')
+        buf.clear()
+        return result
 
     def send(self, command: str) -> None:
         """
@@ -110,6 +129,68 @@ class MooClient:
 
         self._socket.sendall(command.encode('utf-8'))
 
+    def fileno(self) -> int:
+        """Return the socket's file descriptor, for use with selectors."""
+        return self._socket.fileno()
+
+    def start_eval(self, expression: str) -> bool:
+        """
+        Send a MOO expression without waiting for its result.
+
+        Output already buffered counts toward the result. Follow with
+        feed_eval() until it returns True, then finish_eval().
+
+        Args:
+            expression: The MOO expression to evaluate.
+
+        Returns:
+            True if the buffered output already completes the result.
+        """
+        # Send as a programmer command (prefix with ;)
+        if not expression.startswith(';'):
+            expression = ';' + expression
+
+        self.send(expression)
+        self._eval_scanned, self._eval_complete = scan_eval_response(self._buffer, 0)
+        return self._eval_complete
+
+    def feed_eval(self) -> bool:
+        """
+        Receive once from the socket into the pending eval's result.
+
+        Returns:
+            True once the line that completes the result has arrived.
+
+        Raises:
+            EOFError: If the server closed the connection.
+            OSError: If the receive failed or timed out.
+        """
+        chunk = self._socket.recv(4096)
+        if not chunk:
+            raise EOFError("Connection closed by server")
+        self._buffer += chunk
+        self._eval_scanned, self._eval_complete = scan_eval_response(
+            self._buffer, self._eval_scanned)
+        return self._eval_complete
+
+    def finish_eval(self) -> Tuple[bool, str]:
+        """
+        Parse the pending eval's result and remove it from the buffer.
+
+        An incomplete result (timeout or closed connection) takes everything
+        received; anything after a completing line stays in the buffer.
+
+        Returns:
+            Tuple of (success, result_or_error).
+        """
+        buf = self._buffer
+        end = self._eval_scanned if self._eval_complete else len(buf)
+        # Decode once so multi-byte characters split across recv() calls survive
+        response = buf[:end].decode('utf-8', errors='replace')
+        del buf[:end]
+        self._eval_scanned, self._eval_complete = 0, False
+        return parse_eval_response(response)
+
     def receive_line(self, timeout: Optional[float] = None) -> str:
         """
         Receive a single line from the server.
@@ -145,13 +226,14 @@ class MooClient:
         Args:
             command: The command to send.
             timeout: Timeout for receiving response.
-            delay: Delay before reading response to allow processing.
+            delay: Longest time to wait for the server to start responding;
+                reading begins as soon as output arrives.
 
         Returns:
             The server's response.
         """
         self.send(command)
-        time.sleep(delay)
+        self._wait_for_output(delay)
         return self.receive(timeout)
 
     def eval(self, expression: str, timeout: Optional[float] = None) -> Tuple[bool, str]:
@@ -167,47 +249,20 @@ class MooClient:
             - If success is True, result_or_error contains the value.
             - If success is False, result_or_error contains the error message.
         """
-        # Send as a programmer command (prefix with ;)
-        if not expression.startswith(';'):
-            expression = ';' + expression
-
-        self.send(expression)
-
-        # Read response lines until we have a complete result
+        # Read until the line that completes the result
         # - Success: single line with "=> value"
         # - Compile error: single line "** {errors}"
         # - Runtime error: multiple lines ending with "(End of traceback)"
-        timeout = timeout or self.timeout
-        lines = []
-        while True:
-            line = self._read_line(timeout)
-            if not line:
-                break
-            lines.append(line)
-            # Check for completion markers
-            if '=>' in line or '(End of traceback)' in line:
-                break
-            if line.startswith('**') and '{' in line and line.rstrip().endswith('}'):
-                break
-
-        response = ''.join(lines)
-
-        # Check for success: "#-1:  => value"
-        match = self.EVAL_SUCCESS_PATTERN.search(response)
-        if match:
-            return True, match.group(1).strip()
-
-        # Check for error: "** error_info" or traceback
-        match = self.EVAL_ERROR_PATTERN.search(response)
-        if match:
-            return False, match.group(1).strip()
-
-        # Check for traceback (multi-line error)
-        if self.EVAL_TRACEBACK_PATTERN.search(response):
-            return False, response.strip()
-
-        # Couldn't parse - return raw response as failure
-        return False, response.strip() if response.strip() else "(no response)"
+        if not self.start_eval(expression):
+            self._socket.settimeout(timeout or self.timeout)
+            try:
+                while not self.feed_eval():
+                    pass
+            except (socket.timeout, EOFError):
+                pass
+            finally:
+                self._socket.settimeout(self.timeout)
+        return self.finish_eval()
 
     def eval_expect_success(self, expression: str, timeout: Optional[float] = None) -> str:
         """
@@ -289,11 +344,73 @@ class MooClientPool:
         """
         self.host = host
         self.port = port
-        self.clients: List[MooClient] = []
 
-        for _ in range(size):
-            client = MooClient(host, port)
-            self.clients.append(client)
+        # Connect concurrently so the handshakes and welcome reads overlap
+        with ThreadPoolExecutor(max_workers=max(size, 1)) as executor:
+            futures = [executor.submit(MooClient, host, port) for _ in range(size)]
+
+        self.clients: List[MooClient] = [
+            future.result() for future in futures if future.exception() is None
+        ]
+        for future in futures:
+            if future.exception() is not None:
+                self.close_all()
+                raise future.exception()
+
+    def broadcast_eval(self,
+                       expression: str,
+                       timeout: Optional[float] = None) -> List[Tuple[bool, str]]:
+        """
+        Evaluate a MOO expression on every client in the pool at once.
+
+        The expression is sent on all connections before any response is
+        read, and responses are collected with a selector as they arrive.
+
+        Args:
+            expression: The MOO expression to evaluate.
+            timeout: Overall timeout. Uses the longest client timeout if None.
+
+        Returns:
+            One (success, result_or_error) tuple per client, in pool order.
+            A client whose connection failed or closed gets (False, error).
+        """
+        if not self.clients:
+            return []
+
+        timeout = timeout or max(client.timeout for client in self.clients)
+        deadline = time.monotonic() + timeout
+        # A client whose connection fails gets an error in place of a result
+        errors: List[Optional[str]] = [None] * len(self.clients)
+
+        with selectors.DefaultSelector() as selector:
+            for index, client in enumerate(self.clients):
+                try:
+                    if not client.start_eval(expression):
+                        selector.register(client, selectors.EVENT_READ, index)
+                except OSError as e:
+                    errors[index] = f"Connection error: {e}"
+
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    index = key.data
+                    try:
+                        done = key.fileobj.feed_eval()
+                    except (EOFError, OSError) as e:
+                        errors[index] = f"Connection error: {e}"
+                        done = True
+                    if done:
+                        selector.unregister(key.fileobj)
+
+        # Every client's response is consumed, even if another one failed;
+        # like eval(), a client that timed out returns all it sent
+        results = []
+        for client, error in zip(self.clients, errors):
+            result = client.finish_eval()
+            results.append(result if error is None else (False, error))
+        return results
 
     def close_all(self):
         """Close all clients in the pool."""
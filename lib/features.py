@@ -11,9 +11,19 @@ Server Configuration Options (from ./configure):
 - waif_dict: Waif dictionary syntax (--enable-waifs=dict or --enable-def-WAIF_DICT)
 """
 
+import functools
+import re
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 
+# Matches each string element of a flat MOO list such as {"a", "b"}
+_MOO_STRING_ITEM = re.compile(r'"([^"]*)"')
+
+# Tokens that structure an options list; quoted strings are matched whole so
+# braces and commas inside them are ignored
+_OPTIONS_TOKEN = re.compile(r'"[^"]*"|[{},]')
+_INT_LITERAL = re.compile(r'-?\d+')
+
 
 @dataclass
 class ServerFeatures:
@@ -32,6 +42,16 @@ class ServerFeatures:
     has_regexp: bool = False
     has_bitwise: bool = False
 
+    # Cached properties computed from the flags above
+    _DERIVED = ('config_name', '_feature_map')
+
+    def __setattr__(self, name, value):
+        # Flags can be overridden after detection, so drop the cached values
+        if name.startswith('has_'):
+            for derived in self._DERIVED:
+                self.__dict__.pop(derived, None)
+        super().__setattr__(name, value)
+
     def __post_init__(self):
         """Derive feature flags from raw options."""
         # Check INT_TYPE_BITSIZE for i64
@@ -52,7 +72,7 @@ class ServerFeatures:
         bitwise_opt = self.options.get('BITWISE_OPERATORS')
         self.has_bitwise = 'bitwise' in self.features or bitwise_opt is True
 
-    @property
+    @functools.cached_property
     def config_name(self) -> str:
         """Generate a configuration name from detected features."""
         parts = []
@@ -72,9 +92,9 @@ class ServerFeatures:
 
         return '_'.join(parts) if parts else 'default'
 
-    def supports(self, *required_features: str) -> bool:
-        """Check if all required features are available."""
-        feature_map = {
+    @functools.cached_property
+    def _feature_map(self) -> Dict[str, bool]:
+        return {
             'i64': self.has_i64,
             'i32': not self.has_i64,
             'unicode': self.has_unicode,
@@ -84,6 +104,10 @@ class ServerFeatures:
             'regexp': self.has_regexp,
             'bitwise': self.has_bitwise,
         }
+
+    def supports(self, *required_features: str) -> bool:
+        """Check if all required features are available."""
+        feature_map = self._feature_map
         return all(feature_map.get(f, False) for f in required_features)
 
 
@@ -106,12 +130,7 @@ def detect_features(client) -> ServerFeatures:
     # Get features list
     success, result = client.eval('server_version("features");')
     if success and result.startswith('{'):
-        # Parse MOO list: {"feat1", "feat2"}
-        content = result[1:-1]
-        for item in content.split(','):
-            item = item.strip().strip('"')
-            if item:
-                features.features.append(item)
+        features.features = parse_string_list(result)
 
     # Get options dict
     success, result = client.eval('server_version("options");')
@@ -124,6 +143,18 @@ def detect_features(client) -> ServerFeatures:
     return features
 
 
+def parse_string_list(moo_list: str) -> List[str]:
+    """Parse a flat MOO list of strings, e.g. {"feat1", "feat2"}.
+
+    Args:
+        moo_list: MOO literal as returned by eval
+
+    Returns:
+        The non-empty string elements, in order
+    """
+    return [item for item in _MOO_STRING_ITEM.findall(moo_list) if item]
+
+
 def _parse_options_list(moo_list: str) -> Dict[str, Any]:
     """Parse a MOO options list into a dictionary.
 
@@ -135,58 +166,45 @@ def _parse_options_list(moo_list: str) -> Dict[str, Any]:
     """
     options = {}
 
-    # Simple parser for the nested list format
     # Remove outer braces
     content = moo_list.strip()[1:-1]
 
-    # Find each {key, value} pair
+    # Walk the braces, commas and quoted strings; keys and values are sliced
+    # out of content between the token positions
     depth = 0
-    current = ""
-    pairs = []
-
-    for char in content:
+    start = comma = None
+    for token in _OPTIONS_TOKEN.finditer(content):
+        char = token.group()
         if char == '{':
             depth += 1
             if depth == 1:
-                current = ""
-                continue
+                start, comma = token.end(), None
         elif char == '}':
             depth -= 1
-            if depth == 0:
-                pairs.append(current.strip())
-                continue
-        if depth > 0:
-            current += char
-
-    # Parse each pair
-    for pair in pairs:
-        # Split on first comma not in quotes
-        in_quotes = False
-        for i, char in enumerate(pair):
-            if char == '"':
-                in_quotes = not in_quotes
-            elif char == ',' and not in_quotes:
-                key = pair[:i].strip().strip('"')
-                value = pair[i+1:].strip()
-
-                # Parse value
-                if value.isdigit() or (value.startswith('-') and value[1:].isdigit()):
-                    options[key] = int(value)
-                elif value.startswith('"') and value.endswith('"'):
-                    options[key] = value[1:-1]
-                elif value == '#-1':
-                    # Object #-1 means "not defined" in version_options
-                    options[key] = False
-                elif value == '{0}':
-                    # List {0} means "defined" in version_options
-                    options[key] = True
-                else:
-                    options[key] = value
-                break
+            if depth == 0 and comma is not None:
+                key = content[start:comma].strip().strip('"')
+                options[key] = _parse_option_value(content[comma + 1:token.start()].strip())
+        elif char == ',' and depth == 1 and comma is None:
+            comma = token.start()
 
     return options
 
 
+def _parse_option_value(value: str) -> Any:
+    """Convert one server_version("options") value to a Python value."""
+    if _INT_LITERAL.fullmatch(value):
+        return int(value)
+    if value.startswith('"') and value.endswith('"'):
+        return value[1:-1]
+    if value == '#-1':
+        # Object #-1 means "not defined" in version_options
+        return False
+    if value == '{0}':
+        # List {0} means "defined" in version_options
+        return True
+    return value
+
+
 # Feature requirement constants for test marking
 REQUIRES_I64 = 'i64'
 REQUIRES_UNICODE = 'unicode'
@@ -6,6 +6,7 @@ ClientProtocol for LambdaMOO servers.
 
 import os
 import re
+import select
 import shutil
 import signal
 import socket
@@ -20,6 +21,8 @@ from .protocol import (
     ClientProtocol,
     ServerConfig,
     ServerInstance,
+    parse_eval_response,
+    scan_eval_response,
 )
 
 
@@ -50,24 +53,39 @@ class MooServerInstance(ServerInstance):
             return self.log_file.read_text()
         return ""
 
+    def get_log_tail(self, max_bytes: int = 8192) -> str:
+        """Read at most the last max_bytes of the server log.
+
+        Args:
+            max_bytes: Upper bound on the number of bytes read from the end
+
+        Returns:
+            The log tail, starting at a line boundary when truncated
+        """
+        try:
+            with open(self.log_file, 'rb') as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - max_bytes))
+                data = f.read()
+        except FileNotFoundError:
+            return ""
+
+        if size > max_bytes:
+            # Drop the partial first line
+            data = data.partition(b'\n')[2]
+        return data.decode('utf-8', errors='replace')
+
 
 class MooClient(ClientProtocol):
     """LambdaMOO client implementation using TCP sockets."""
 
-    # Patterns to match MOO evaluation results from do_command verb:
-    # Success: "#-1:  => value" (caller object followed by result)
-    EVAL_SUCCESS_PATTERN = re.compile(r'^[#\-\d]+:\s*=>\s*(.+)$', re.MULTILINE)
-    # Error from eval(): "** error_info" (always indicates failure)
-    EVAL_ERROR_PATTERN = re.compile(r'^\*\*\s+(.+)$', re.MULTILINE)
-    # Traceback: multi-line error with "(End of traceback)"
-    EVAL_TRACEBACK_PATTERN = re.compile(r'^#[^:]+:.*line\s+\d+:', re.MULTILINE)
-
     def __init__(self, host: str = 'localhost', port: int = 7777,
                  timeout: float = 5.0, trace: bool = False, trace_file=None):
         self.host = host
         self.port = port
         self.timeout = timeout
         self._socket: Optional[socket.socket] = None
+        self._buffer = bytearray()  # Received bytes not yet returned
         self._connected = False
         self._trace = trace
         self._trace_file = trace_file  # File object or None for stderr
@@ -102,14 +120,30 @@ class MooClient(ClientProtocol):
         """
         return list(self._transcript)
 
-    def format_transcript(self) -> str:
-        """Format the transcript as a human-readable string."""
+    def format_transcript(self, max_bytes: Optional[int] = None) -> str:
+        """Format the transcript as a human-readable string.
+
+        Args:
+            max_bytes: If given, keep only the most recent entries that fit
+                in roughly this many characters
+
+        Returns:
+            One line per transcript entry, oldest first
+        """
         lines = []
-        for direction, timestamp, data in self._transcript:
+        remaining = max_bytes
+        for direction, timestamp, data in reversed(self._transcript):
             prefix = '>>>' if direction == 'SEND' else '<<<'
             # Show data with visible newlines
             display_data = data.replace('\n', '\\n')
-            lines.append(f"[{timestamp}] {prefix} {display_data}")
+            line = f"[{timestamp}] {prefix} {display_data}"
+            if remaining is not None:
+                remaining -= len(line) + 1
+                if remaining < 0:
+                    lines.append('... (truncated) ...')
+                    break
+            lines.append(line)
+        lines.reverse()
         return '\n'.join(lines)
 
     def connect(self) -> None:
@@ -117,10 +151,13 @@ class MooClient(ClientProtocol):
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self._socket.settimeout(self.timeout)
         self._socket.connect((self.host, self.port))
+        # Commands are small writes; send them without waiting on Nagle
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._buffer.clear()
         self._connected = True
 
         # Read initial connection output (welcome message, etc.)
-        time.sleep(0.1)
+        self._wait_for_output(0.1)
         self._read_available()
 
     def close(self) -> None:
@@ -137,25 +174,38 @@ class MooClient(ClientProtocol):
         """Check if still connected to server."""
         return self._connected and self._socket is not None
 
+    def _wait_for_output(self, timeout: float) -> bool:
+        """Wait until the server has sent data, or timeout seconds pass."""
+        if self._buffer:
+            return True
+        readable, _, _ = select.select([self._socket], [], [], timeout)
+        return bool(readable)
+
     def _read_line(self, timeout: Optional[float] = None) -> str:
-        """Read a single line from the socket."""
-        timeout = timeout or self.timeout
-        self._socket.settimeout(timeout)
-        data = []
-        try:
-            while True:
-                chunk = self._socket.recv(1)
-                if not chunk:
-                    break
-                char = chunk.decode('utf-8', errors='replace')
-                data.append(char)
-                if char == '\n':
-                    break
-        except socket.timeout:
-            pass
-        finally:
-            self._socket.settimeout(self.timeout)
-        result = ''.join(data)
+        """Read a single line from the socket.
+
+        Data is received in chunks; anything after the newline stays in the
+        buffer for the next read.
+        """
+        buf = self._buffer
+        idx = buf.find(b'\n')
+        if idx < 0:
+            self._socket.settimeout(timeout or self.timeout)
+            try:
+                while idx < 0:
+                    chunk = self._socket.recv(4096)
+                    if not chunk:
+                        break
+                    start = len(buf)
+                    buf += chunk
+                    idx = buf.find(b'\n', start)
+            except socket.timeout:
+                pass
+            finally:
+                self._socket.settimeout(self.timeout)
+        end = idx + 1 if idx >= 0 else len(buf)
+        result = buf[:end].decode('utf-8', errors='replace')
+        del buf[:end]
         if result:
             self._log_trace('RECV', result)
         return result
@@ -163,18 +213,48 @@ class MooClient(ClientProtocol):
     def _read_available(self, timeout: float = 0.05) -> str:
         """Read any immediately available data."""
         self._socket.settimeout(timeout)
-        data = []
+        buf = self._buffer
         try:
             while True:
                 chunk = self._socket.recv(4096)
                 if not chunk:
                     break
-                data.append(chunk.decode('utf-8', errors='replace'))
+                buf += chunk
         except socket.timeout:
             pass
         finally:
             self._socket.settimeout(self.timeout)
-        result = ''.join(data)
+        # Decode once so multi-byte characters split across recv() calls survive
+        result = buf.decode('utf-8', errors='replace')
+        buf.clear()
+        if result:
+            self._log_trace('RECV', result)
+        return result
+
+    def _read_eval_response(self, timeout: float) -> str:
+        """Read the output of one eval, up to the line that completes it.
+
+        Lines are checked in the byte buffer and the response is decoded once;
+        anything after the completing line stays in the buffer.
+        """
+        buf = self._buffer
+        scanned, complete = scan_eval_response(buf, 0)
+        if not complete:
+            self._socket.settimeout(timeout)
+            try:
+                while not complete:
+                    chunk = self._socket.recv(4096)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    scanned, complete = scan_eval_response(buf, scanned)
+            except socket.timeout:
+                pass
+            finally:
+                self._socket.settimeout(self.timeout)
+        end = scanned if complete else len(buf)
+        result = buf[:end].decode('utf-8', errors='replace')
+        del buf[:end]
         if result:
             self._log_trace('RECV', result)
         return result
@@ -204,7 +284,7 @@ class MooClient(ClientProtocol):
     def authenticate(self, identity: str) -> bool:
         """Authenticate as a user (e.g., 'Wizard')."""
         self._send(f"connect {identity}")
-        time.sleep(0.1)
+        self._wait_for_output(0.1)
         response = self._read_available()
         # Check for indicators of successful connection
         return "***" not in response.lower() or "connected" in response.lower()
@@ -217,38 +297,7 @@ class MooClient(ClientProtocol):
 
         self._send(expression)
 
-        # Read response lines until we have a complete result
-        timeout = timeout or self.timeout
-        lines = []
-        while True:
-            line = self._read_line(timeout)
-            if not line:
-                break
-            lines.append(line)
-            # Check for completion markers
-            if '=>' in line or '(End of traceback)' in line:
-                break
-            if line.startswith('**') and '{' in line and line.rstrip().endswith('}'):
-                break
-
-        response = ''.join(lines)
-
-        # Check for success: "#-1:  => value"
-        match = self.EVAL_SUCCESS_PATTERN.search(response)
-        if match:
-            return True, match.group(1).strip()
-
-        # Check for error: "** error_info" or traceback
-        match = self.EVAL_ERROR_PATTERN.search(response)
-        if match:
-            return False, match.group(1).strip()
-
-        # Check for traceback (multi-line error)
-        if self.EVAL_TRACEBACK_PATTERN.search(response):
-            return False, response.strip()
-
-        # Couldn't parse - return raw response as failure
-        return False, response.strip() if response.strip() else "(no response)"
+        return parse_eval_response(self._read_eval_response(timeout or self.timeout))
 
     def eval_expect_success(self, expression: str, timeout: Optional[float] = None) -> str:
         """
@@ -3,15 +3,87 @@
 This module defines the abstract interfaces that any MOO-compatible server
 must implement to be testable with this test suite. This allows testing
 different server implementations (LambdaMOO, ToastStunt, etc.) with the
-same test code.
+same test code. It also holds the parser for eval output, which is shared
+by the client implementations.
 """
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Tuple, Optional, Dict, Any
 
 
+# Runtime error traceback from do_command: "#-1:Input to EVAL, line 3:  ..."
+_EVAL_TRACEBACK_PATTERN = re.compile(r'^#[^:]+:.*line\s+\d+:', re.MULTILINE)
+
+# Characters of the caller prefix in a success line ("#-1:  => value")
+_CALLER_CHARS = '#-0123456789'
+
+
+def parse_eval_response(response: str) -> Tuple[bool, str]:
+    """Classify the output of a do_command eval.
+
+    Success lines look like "#-1:  => value" and take precedence, then
+    "** error" lines; a runtime error traceback is returned whole.
+
+    Args:
+        response: Lines read from the server for one eval.
+
+    Returns:
+        Tuple of (success, result_or_error).
+    """
+    lines = response.split('\n')
+
+    for line in lines:
+        head, sep, value = line.partition('=>')
+        if sep and value:
+            head = head.rstrip()
+            if len(head) > 1 and head[-1] == ':' and not head[:-1].strip(_CALLER_CHARS):
+                return True, value.strip()
+
+    for line in lines:
+        if line.startswith('**') and len(line) > 3 and line[2].isspace():
+            return False, line[2:].strip()
+
+    stripped = response.strip()
+    if _EVAL_TRACEBACK_PATTERN.search(response):
+        return False, stripped
+
+    # Couldn't parse - return raw response as failure
+    return False, stripped if stripped else "(no response)"
+
+
+def _ends_eval(line: bytes) -> bool:
+    """Check whether a response line completes an eval result."""
+    if b'=>' in line or b'(End of traceback)' in line:
+        return True
+    return line.startswith(b'**') and b'{' in line and line.rstrip().endswith(b'}')
+
+
+def scan_eval_response(buffer: bytearray, start: int) -> Tuple[int, bool]:
+    """Check the complete lines of buffer from offset start for an eval's end.
+
+    A trailing partial line is left unchecked, so the caller can append more
+    bytes and resume from the returned offset.
+
+    Args:
+        buffer: Bytes received for the eval so far.
+        start: Offset of the first line not yet checked.
+
+    Returns:
+        Tuple of (offset past the last line checked, whether it ended the result).
+    """
+    while True:
+        idx = buffer.find(b'\n', start)
+        if idx < 0:
+            return start, False
+        line = buffer[start:idx + 1]
+        start = idx + 1
+        if _ends_eval(line):
+            return start, True
+
+
 @dataclass
 class ServerConfig:
     """Configuration for a server instance."""
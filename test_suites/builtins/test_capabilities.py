@@ -22,7 +22,7 @@ class TestIntegerCapabilities:
     """Tests that verify integer handling varies by server configuration.
 
     Note: On 64-bit platforms, even the "default" build typically uses 64-bit
-    integers (INT_TYPE_BITSIZE=64). The requires_no_i64 tests will only run
+    integers (INT_TYPE_BITSIZE=64). The requires("no_i64") tests will only run
     on actual 32-bit servers, which are rare in modern environments.
     """
 
@@ -32,27 +32,31 @@ class TestIntegerCapabilities:
     LARGE_64BIT = 9223372036854775807  # 2^63 - 1 (max signed 64-bit)
     OVERFLOW_32BIT = 2147483648      # 2^31 (overflows signed 32-bit)
 
-    def test_cap_i64_large_positive_works(self, client, requires_i64):
+    @pytest.mark.requires('i64')
+    def test_cap_i64_large_positive_works(self, client):
         """On i64 servers, large positive integers work correctly."""
         result = client.eval(f'{self.LARGE_64BIT}')
         value = assert_moo_success(result)
         assert value == str(self.LARGE_64BIT), f"Large integer not preserved: {value}"
 
-    def test_cap_i64_large_negative_works(self, client, requires_i64):
+    @pytest.mark.requires('i64')
+    def test_cap_i64_large_negative_works(self, client):
         """On i64 servers, large negative integers work correctly."""
         large_neg = -4611686018427387904  # Large negative 64-bit
         result = client.eval(f'{large_neg}')
         value = assert_moo_success(result)
         assert value == str(large_neg), f"Large negative not preserved: {value}"
 
-    def test_cap_i64_arithmetic_no_32bit_overflow(self, client, requires_i64):
+    @pytest.mark.requires('i64')
+    def test_cap_i64_arithmetic_no_32bit_overflow(self, client):
         """On i64 servers, arithmetic near 32-bit boundary doesn't overflow."""
         # This would overflow on a 32-bit server
         result = client.eval(f'{self.MAX_32BIT} + 1')
         value = assert_moo_success(result)
         assert value == str(self.OVERFLOW_32BIT), f"Expected {self.OVERFLOW_32BIT}, got {value}"
 
-    def test_cap_i64_overflow_at_64bit_boundary(self, client, requires_i64):
+    @pytest.mark.requires('i64')
+    def test_cap_i64_overflow_at_64bit_boundary(self, client):
         """On i64 servers, arithmetic at 64-bit boundary wraps or errors.
 
         MAX_64BIT + 1 should wrap to MIN_64BIT (or possibly error).
@@ -72,7 +76,8 @@ class TestIntegerCapabilities:
             # An error is also acceptable for overflow
             pass  # Test passes
 
-    def test_cap_i64_overflow_negative_boundary(self, client, requires_i64):
+    @pytest.mark.requires('i64')
+    def test_cap_i64_overflow_negative_boundary(self, client):
         """On i64 servers, negative overflow at 64-bit boundary wraps or errors.
 
         MIN_64BIT - 1 should wrap to MAX_64BIT (or possibly error).
@@ -88,7 +93,8 @@ class TestIntegerCapabilities:
                 f"64-bit underflow should wrap to {self.LARGE_64BIT}, got {int_value}"
             )
 
-    def test_cap_i32_overflow_wraps_or_errors(self, client, requires_no_i64):
+    @pytest.mark.requires('no_i64')
+    def test_cap_i32_overflow_wraps_or_errors(self, client):
         """On i32 servers, overflow past 32-bit boundary wraps or errors.
 
         The exact behavior depends on the server implementation:
@@ -116,7 +122,8 @@ class TestIntegerCapabilities:
             # An error is also acceptable for overflow
             pass  # Test passes - server correctly rejected overflow
 
-    def test_cap_i32_large_literal_rejected(self, client, requires_no_i64):
+    @pytest.mark.requires('no_i64')
+    def test_cap_i32_large_literal_rejected(self, client):
         """On i32 servers, a 64-bit literal in code should be rejected or truncated."""
         # Try to use a literal that exceeds 32-bit range
         result = client.eval(f'{self.LARGE_64BIT}')
@@ -149,19 +156,22 @@ class TestIntegerCapabilities:
 class TestUnicodeCapabilities:
     """Tests that verify Unicode handling varies by server configuration."""
 
-    def test_cap_unicode_multibyte_length(self, client, requires_unicode):
+    @pytest.mark.requires('unicode')
+    def test_cap_unicode_multibyte_length(self, client):
         """On Unicode servers, multibyte chars count as single characters."""
         # Greek letters α, β, γ - each is one character
         result = client.eval('length("αβγ")')
         assert_moo_int(result, 3, "Unicode server should count 3 characters")
 
-    def test_cap_unicode_emoji_length(self, client, requires_unicode):
+    @pytest.mark.requires('unicode')
+    def test_cap_unicode_emoji_length(self, client):
         """On Unicode servers, emoji count correctly."""
         # Using a simple emoji that's likely to work
         result = client.eval('length("★")')  # Unicode star
         assert_moo_int(result, 1, "Unicode server should count star as 1 char")
 
-    def test_cap_no_unicode_multibyte_stripped_or_bytes(self, client, requires_no_unicode):
+    @pytest.mark.requires('no_unicode')
+    def test_cap_no_unicode_multibyte_stripped_or_bytes(self, client):
         """On non-Unicode servers, multibyte chars are stripped or counted as bytes.
 
         Behavior varies by server:
@@ -171,7 +171,8 @@ class TestSpecialStrings:
 class TestUnicodeStrings:
     """Tests for Unicode string support (requires Unicode build)."""
 
-    def test_str_040_unicode_length(self, client, requires_unicode):
+    @pytest.mark.requires('unicode')
+    def test_str_040_unicode_length(self, client):
         """STR-040: Unicode string length counts codepoints."""
         # Use actual UTF-8 characters, not \u escapes (MOO doesn't support \u syntax)
         # "αβγ" = 3 Greek letters, each is 2 bytes in UTF-8 but 1 codepoint
@@ -180,7 +181,8 @@ class TestUnicodeStrings:
         # Should be 3 codepoints (alpha, beta, gamma)
         assert int(value) == 3
 
-    def test_str_041_unicode_indexing(self, client, requires_unicode):
+    @pytest.mark.requires('unicode')
+    def test_str_041_unicode_indexing(self, client):
         """STR-041: Unicode strings can be indexed by codepoint."""
         # "日本語" = 3 CJK characters, each is 3 bytes in UTF-8 but 1 codepoint
         result = client.eval('length("日本語")')
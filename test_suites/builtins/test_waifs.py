@@ -20,9 +20,11 @@ import pytest
 
 from lib.assertions import assert_moo_success, assert_moo_int, assert_moo_error
 
+pytestmark = pytest.mark.requires('waifs')
+
 
 @pytest.fixture
-def waif_class(client, requires_waifs):
+def waif_class(client):
     """Create a waif class object for testing.
 
     Returns the object number as a string (e.g., '#4').
@@ -82,7 +84,7 @@ class TestWaifCreation:
         result = client.eval(f'{waif_class}:get_wizard()')
         assert_moo_int(result, 0)
 
-    def test_new_waif_requires_waif_property(self, client, requires_waifs):
+    def test_new_waif_requires_waif_property(self, client):
         """new_waif() behavior on object without :properties.
 
         Note: Some implementations allow creating waifs from objects without
@@ -414,7 +416,8 @@ class TestWaifValidObject:
 class TestWaifDict:
     """Tests for WAIF_DICT dictionary syntax (optional feature)."""
 
-    def test_waif_index_read(self, client, waif_class, requires_waif_dict):
+    @pytest.mark.requires('waif_dict')
+    def test_waif_index_read(self, client, waif_class):
         """Waif dictionary read via :_index verb."""
         # Add :_index that returns the value property
         client.eval(f'add_verb({waif_class}, {{{waif_class}, "xd", ":_index"}}, {{"this", "none", "this"}})')
@@ -427,7 +430,8 @@ class TestWaifDict:
         result = client.eval(f'{waif_class}:test_read()')
         assert_moo_int(result, 50)
 
-    def test_waif_set_index_verb(self, client, waif_class, requires_waif_dict):
+    @pytest.mark.requires('waif_dict')
+    def test_waif_set_index_verb(self, client, waif_class):
         """Waif dictionary write via w[key] = value syntax.
 
         The w[key] = value syntax calls :_set_index(key, value) on the waif.
@@ -484,7 +488,7 @@ class TestWaifSpecialCases:
         result = client.eval(f'{waif_class}:store_waif()')
         assert_moo_int(result, 12345)
 
-    def test_multiple_waif_classes(self, client, requires_waifs):
+    def test_multiple_waif_classes(self, client):
         """Waifs can be created from different class objects."""
         # Create two waif classes
         result = client.eval('create(#1)')
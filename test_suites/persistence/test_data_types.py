@@ -138,8 +138,8 @@ class TestStringPersistence:
             server_pair.read_server.stop(read_instance)
 
     @pytest.mark.unicode
-    def test_unicode_strings(self, server_pair: ServerPair, write_server_db, tmp_path,
-                             requires_unicode):
+    @pytest.mark.requires('unicode')
+    def test_unicode_strings(self, server_pair: ServerPair, write_server_db, tmp_path):
         """Unicode strings survive write→read cycle."""
         db_path = tmp_path / "test.db"
         shutil.copy(write_server_db, db_path)
@@ -17,6 +17,8 @@ import pytest
 from lib.protocol import ServerPair
 from lib.assertions import assert_moo_success, assert_moo_int
 
+pytestmark = pytest.mark.requires('waifs')
+
 
 def setup_waif_class(client, class_obj):
     """Set up a waif class with standard properties and verbs.
@@ -45,7 +47,7 @@ class TestWaifPersistence:
     """Tests for basic waif persistence through checkpoint/upgrade."""
 
     def test_waif_survives_checkpoint(self, server_pair: ServerPair, write_server_db,
-                                       tmp_path, requires_waifs):
+                                       tmp_path):
         """A waif stored in a property survives write→read cycle."""
         db_path = tmp_path / "test.db"
         shutil.copy(write_server_db, db_path)
@@ -110,7 +112,7 @@ class TestWaifPersistence:
             server_pair.read_server.stop(read_instance)
 
     def test_waif_with_list_property(self, server_pair: ServerPair, write_server_db,
-                                      tmp_path, requires_waifs):
+                                      tmp_path):
         """Waif with list property survives write→read cycle."""
         db_path = tmp_path / "test.db"
         shutil.copy(write_server_db, db_path)
@@ -158,7 +160,7 @@ class TestWaifPersistence:
             server_pair.read_server.stop(read_instance)
 
     def test_multiple_waifs_same_class(self, server_pair: ServerPair, write_server_db,
-                                        tmp_path, requires_waifs):
+                                        tmp_path):
         """Multiple waifs from same class survive independently."""
         db_path = tmp_path / "test.db"
         shutil.copy(write_server_db, db_path)
@@ -208,7 +210,7 @@ class TestWaifPersistence:
             server_pair.read_server.stop(read_instance)
 
     def test_waif_owner_preserved(self, server_pair: ServerPair, write_server_db,
-                                   tmp_path, requires_waifs):
+                                   tmp_path):
         """Waif .owner is preserved through checkpoint."""
         db_path = tmp_path / "test.db"
         shutil.copy(write_server_db, db_path)
@@ -264,7 +266,7 @@ class TestWaifClassPersistence:
     """Tests for waif class object persistence."""
 
     def test_waif_class_properties_preserved(self, server_pair: ServerPair, write_server_db,
-                                              tmp_path, requires_waifs):
+                                              tmp_path):
         """Waif class :properties survive checkpoint."""
         db_path = tmp_path / "test.db"
         shutil.copy(write_server_db, db_path)
@@ -309,7 +311,7 @@ class TestWaifClassPersistence:
             server_pair.read_server.stop(read_instance)
 
     def test_waif_class_verbs_preserved(self, server_pair: ServerPair, write_server_db,
-                                         tmp_path, requires_waifs):
+                                         tmp_path):
         """Waif class :verbs survive checkpoint."""
         db_path = tmp_path / "test.db"
         shutil.copy(write_server_db, db_path)
@@ -367,7 +369,7 @@ class TestWaifEdgeCases:
     """Tests for edge cases in waif persistence."""
 
     def test_waif_in_nested_list(self, server_pair: ServerPair, write_server_db,
-                                  tmp_path, requires_waifs):
+                                  tmp_path):
         """Waif inside nested list structure survives checkpoint."""
         db_path = tmp_path / "test.db"
         shutil.copy(write_server_db, db_path)
@@ -413,7 +415,7 @@ class TestWaifEdgeCases:
             server_pair.read_server.stop(read_instance)
 
     def test_waif_default_property_values(self, server_pair: ServerPair, write_server_db,
-                                           tmp_path, requires_waifs):
+                                           tmp_path):
         """New waifs get correct default property values after restore."""
         db_path = tmp_path / "test.db"
         shutil.copy(write_server_db, db_path)
@@ -0,0 +1 @@
+"""Offline tests of the harness and library helpers (no server needed)."""
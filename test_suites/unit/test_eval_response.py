@@ -0,0 +1,83 @@
+"""Tests for the eval output parser and scanner in lib.protocol."""
+
+import pytest
+
+from lib.protocol import parse_eval_response, scan_eval_response
+
+
+TRACEBACK = (
+    "#-1:Input to EVAL (this == #-1), line 3:  Division by zero\n"
+    "... called from #-1:eval_helper, line 1\n"
+    "(End of traceback)\n"
+)
+
+
+class TestParseEvalResponse:
+    """parse_eval_response() classification of eval output."""
+
+    @pytest.mark.parametrize('response, value', [
+        ('#-1:  => 3\n', '3'),
+        ('#-1:  => "a => b"\n', '"a => b"'),
+        ('#123:  => {1, 2}\r\n', '{1, 2}'),
+    ])
+    def test_success_line(self, response, value):
+        """A caller-prefixed => line is a success with the value after it."""
+        assert parse_eval_response(response) == (True, value)
+
+    def test_arrow_without_caller_prefix_is_not_success(self):
+        """Output that merely contains => is not mistaken for a result."""
+        success, _ = parse_eval_response('notify: x => y\n')
+        assert not success
+
+    def test_error_line(self):
+        """A ** line is a failure with the text after the stars."""
+        assert parse_eval_response('** {"Expected ..."}\n') == (False, '{"Expected ..."}')
+
+    def test_traceback_is_returned_whole(self):
+        """A runtime error traceback is a failure carrying every line."""
+        assert parse_eval_response(TRACEBACK) == (False, TRACEBACK.strip())
+
+    def test_multi_line_output_before_result(self):
+        """Output printed by the expression precedes the result line."""
+        response = 'hello\n** not an error\n#-1:  => 0\n'
+        assert parse_eval_response(response) == (True, '0')
+
+    def test_empty_response(self):
+        """No output is a failure with a placeholder message."""
+        assert parse_eval_response('') == (False, '(no response)')
+
+
+class TestScanEvalResponse:
+    """scan_eval_response() detection of the line that completes an eval."""
+
+    @pytest.mark.parametrize('data', [
+        b'#-1:  => 3\n',
+        b'** {"Expected ..."}\n',
+        TRACEBACK.encode(),
+    ])
+    def test_complete(self, data):
+        """Each kind of result ends at its completing line."""
+        assert scan_eval_response(bytearray(data), 0) == (len(data), True)
+
+    def test_stops_after_completing_line(self):
+        """Lines after the result are left for the next eval."""
+        buf = bytearray(b'hello\n#-1:  => 1\n#-1:  => 2\n')
+        assert scan_eval_response(buf, 0) == (len(b'hello\n#-1:  => 1\n'), True)
+
+    def test_partial_line_is_not_checked(self):
+        """A line without its newline is left for the next call."""
+        buf = bytearray(b'hello\n#-1:  =>')
+        assert scan_eval_response(buf, 0) == (len(b'hello\n'), False)
+
+    def test_resume_from_offset(self):
+        """Scanning resumes at the returned offset once more bytes arrive."""
+        buf = bytearray(b'hello\n#-1:  =>')
+        scanned, complete = scan_eval_response(buf, 0)
+        assert not complete
+        buf += b' 5\n'
+        assert scan_eval_response(buf, scanned) == (len(buf), True)
+
+    def test_traceback_waits_for_end_marker(self):
+        """A traceback is incomplete until its (End of traceback) line."""
+        head = TRACEBACK.encode().rsplit(b'(End', 1)[0]
+        assert scan_eval_response(bytearray(head), 0) == (len(head), False)
@@ -0,0 +1,103 @@
+"""Tests for the server_version() list parsers in lib.features.
+
+Expected values for the representative inputs are what the original
+character-by-character parsers produced; the quoted-delimiter cases are
+ones those parsers got wrong.
+"""
+
+import pytest
+
+from lib.features import _parse_option_value, _parse_options_list, parse_string_list
+
+
+OPTIONS = (
+    '{{"NETWORK_PROTOCOL", "NP_TCP"}, {"DEFAULT_MAX_STACK_DEPTH", 50}, '
+    '{"OUTBOUND_NETWORK", #-1}, {"UNFORKED_CHECKPOINTS", {0}}, '
+    '{"INT_TYPE_BITSIZE", 64}}'
+)
+
+
+class TestParseOptionsList:
+    """_parse_options_list() on server_version("options") output."""
+
+    def test_representative_options(self):
+        """Strings, numbers and the #-1 / {0} flags are converted."""
+        assert _parse_options_list(OPTIONS) == {
+            'NETWORK_PROTOCOL': 'NP_TCP',
+            'DEFAULT_MAX_STACK_DEPTH': 50,
+            'OUTBOUND_NETWORK': False,
+            'UNFORKED_CHECKPOINTS': True,
+            'INT_TYPE_BITSIZE': 64,
+        }
+
+    @pytest.mark.parametrize('moo_list', ['{}', '{ }'])
+    def test_empty_list(self, moo_list):
+        """An empty list has no options."""
+        assert _parse_options_list(moo_list) == {}
+
+    def test_negative_numbers(self):
+        """Negative integers, including 64-bit ones, are converted."""
+        moo_list = '{{"MIN_INT", -9223372036854775808}, {"OFFSET", -5}}'
+        assert _parse_options_list(moo_list) == {
+            'MIN_INT': -9223372036854775808,
+            'OFFSET': -5,
+        }
+
+    def test_nested_braces(self):
+        """A nested list value is kept as its literal text."""
+        moo_list = '{{"LIST", {1, {2, 3}}}, {"NEXT", 1}}'
+        assert _parse_options_list(moo_list) == {'LIST': '{1, {2, 3}}', 'NEXT': 1}
+
+    def test_value_after_first_comma(self):
+        """Only the first comma of a pair separates the key."""
+        assert _parse_options_list('{{"K", "x,y", 3}}') == {'K': '"x,y", 3'}
+
+    def test_pair_without_value_is_skipped(self):
+        """A one-element entry has no value and is ignored."""
+        assert _parse_options_list('{{"ALONE"}}') == {}
+
+    @pytest.mark.parametrize('moo_list, expected', [
+        ('{{"SOURCE", "git, {dirty}"}}', {'SOURCE': 'git, {dirty}'}),
+        ('{{"SOURCE", "a}b"}, {"NEXT", 2}}', {'SOURCE': 'a}b', 'NEXT': 2}),
+    ])
+    def test_delimiters_inside_strings(self, moo_list, expected):
+        """Braces and commas inside quoted values do not split the pair."""
+        assert _parse_options_list(moo_list) == expected
+
+
+class TestParseOptionValue:
+    """_parse_option_value() conversion of a single value."""
+
+    @pytest.mark.parametrize('value, expected', [
+        ('64', 64),
+        ('-1', -1),
+        ('"NP_TCP"', 'NP_TCP'),
+        ('""', ''),
+        ('#-1', False),
+        ('{0}', True),
+        ('#5', '#5'),
+        ('1.5', '1.5'),
+    ])
+    def test_conversion(self, value, expected):
+        """Each literal form maps to its Python value."""
+        assert _parse_option_value(value) == expected
+
+
+class TestParseStringList:
+    """parse_string_list() on server_version("features") output."""
+
+    def test_representative_features(self):
+        """Each quoted name becomes an element, in order."""
+        assert parse_string_list('{"i64", "unicode", "waifs"}') == ['i64', 'unicode', 'waifs']
+
+    def test_empty_list(self):
+        """An empty list has no features."""
+        assert parse_string_list('{}') == []
+
+    def test_empty_strings_are_dropped(self):
+        """Empty string elements are skipped."""
+        assert parse_string_list('{"", "x"}') == ['x']
+
+    def test_quoted_comma(self):
+        """A comma inside a string does not split the element."""
+        assert parse_string_list('{"a,b", "c"}') == ['a,b', 'c']
@@ -0,0 +1,106 @@
+"""Tests for repository resolution and cached clones in harness.repos."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from harness.repos import KNOWN_REPOS, get_commit_hash, get_or_clone_repo, resolve_repo_url
+
+
+class TestResolveRepoUrl:
+    """resolve_repo_url() classification of names, URLs and paths."""
+
+    def test_known_name(self):
+        """Known repository names map to their URLs."""
+        assert resolve_repo_url('lambdamoo') == KNOWN_REPOS['lambdamoo']
+
+    @pytest.mark.parametrize('url', [
+        'https://github.com/wrog/lambdamoo',
+        'ssh://git@github.com/wrog/lambdamoo.git',
+        'file:///srv/git/lambdamoo',
+        'git@github.com:wrog/lambdamoo.git',
+        'user@host/path/to/repo',
+        'user@host',
+    ])
+    def test_url_forms_pass_through(self, url):
+        """Anything containing :// or @ is used as a URL unchanged."""
+        assert resolve_repo_url(url) == url
+
+    def test_existing_local_path(self, tmp_path):
+        """An existing directory resolves to its absolute path."""
+        repo = tmp_path / 'checkout'
+        repo.mkdir()
+        assert resolve_repo_url(str(repo)) == str(repo.resolve())
+
+    def test_unknown_name_raises(self):
+        """A name that is not known, a URL, or a path is rejected."""
+        with pytest.raises(ValueError, match='Unknown repository'):
+            resolve_repo_url('no-such-repo-name')
+
+
+def _git(*args, cwd):
+    """Run git in cwd and return its stripped stdout."""
+    return subprocess.run(
+        ['git', *args], cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch):
+    """A bare upstream with one commit on main, and a work clone that pushes to it."""
+    if shutil.which('git') is None:
+        pytest.skip('git is not installed')
+    for var in ('AUTHOR', 'COMMITTER'):
+        monkeypatch.setenv(f'GIT_{var}_NAME', 'Test')
+        monkeypatch.setenv(f'GIT_{var}_EMAIL', 'test@example.com')
+
+    bare = tmp_path / 'upstream.git'
+    _git('init', '--bare', '--initial-branch=main', str(bare), cwd=tmp_path)
+    work = tmp_path / 'work'
+    _git('clone', str(bare), str(work), cwd=tmp_path)
+    _git('checkout', '-b', 'main', cwd=work)
+
+    def commit(message):
+        (work / 'file.txt').write_text(message)
+        _git('add', 'file.txt', cwd=work)
+        _git('commit', '-m', message, cwd=work)
+        _git('push', 'origin', 'main', cwd=work)
+        return _git('rev-parse', 'HEAD', cwd=work)
+
+    commit('first')
+    return bare.as_uri(), commit
+
+
+class TestGetOrCloneRepo:
+    """get_or_clone_repo() against a local bare upstream."""
+
+    def test_shallow_clone_follows_upstream(self, upstream, tmp_path):
+        """Each update of a depth-1 clone moves it to the new upstream tip."""
+        url, commit = upstream
+        cache = tmp_path / 'cache'
+        repo = get_or_clone_repo(url, cache, depth=1)
+        assert (repo / '.git' / 'shallow').exists()
+
+        for message in ('second', 'third'):
+            tip = commit(message)
+            get_or_clone_repo(url, cache, depth=1, fetch_ttl=0)
+            assert get_commit_hash(repo) == tip
+
+    def test_full_clone_stays_full(self, upstream, tmp_path):
+        """A shallow update of an existing full clone does not truncate it."""
+        url, commit = upstream
+        cache = tmp_path / 'cache'
+        repo = get_or_clone_repo(url, cache)
+        tip = commit('second')
+        get_or_clone_repo(url, cache, depth=1, fetch_ttl=0)
+        assert get_commit_hash(repo) == tip
+        assert not (repo / '.git' / 'shallow').exists()
+
+    def test_short_sha_in_shallow_clone(self, upstream, tmp_path):
+        """An abbreviated hash older than a shallow clone is still checked out."""
+        url, commit = upstream
+        old = commit('second')
+        commit('third')
+        repo = get_or_clone_repo(url, tmp_path / 'cache', ref=old[:7], depth=1)
+        assert get_commit_hash(repo) == old